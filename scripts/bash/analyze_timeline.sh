@@ -55,10 +55,10 @@ source venv/bin/activate
 
 # Check if required packages are installed
 echo -e "${YELLOW}🔍 Checking dependencies...${NC}"
-python -c "import requests, json, pathlib" 2>/dev/null || {
+python -c "import requests, orjson, dotenv" 2>/dev/null || {
     echo -e "${RED}❌ Required packages not installed${NC}"
     echo -e "${YELLOW}Installing dependencies...${NC}"
-    pip install requests
+    pip install requests orjson python-dotenv
 }
 
 # Show available tickers
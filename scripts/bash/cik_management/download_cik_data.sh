@@ -60,6 +60,12 @@ check_dependencies() {
         $PYTHON_CMD -m pip install requests
     fi
     
+    # Check if orjson is installed (download_cik_data.py and cik_lookup.py use it for all JSON)
+    if ! $PYTHON_CMD -c "import orjson" &> /dev/null; then
+        print_warning "orjson package not found. Installing..."
+        $PYTHON_CMD -m pip install orjson
+    fi
+    
     print_success "All dependencies are available"
 }
 
@@ -120,7 +126,7 @@ show_usage() {
     echo "  -q, --quiet    Suppress non-error output"
     echo ""
     echo "Output files will be saved to: $DATA_DIR"
-    echo "  - company_tickers.json (raw SEC data)"
+    echo "  - company_tickers.json.gz (raw SEC data, gzip-compressed as served)"
     echo "  - cik_database.csv (processed CSV format)"
     echo "  - cik_database.json (processed JSON format)"
     echo "  - download_summary.json (summary report)"
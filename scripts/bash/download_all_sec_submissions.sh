@@ -32,10 +32,10 @@ source .venv/bin/activate
 
 # Check if required packages are installed
 echo "Checking dependencies..."
-python -c "import requests, concurrent.futures" 2>/dev/null || {
+python -c "import requests, orjson, concurrent.futures" 2>/dev/null || {
     echo "Error: Required packages not installed"
     echo "Please install dependencies:"
-    echo "  pip install requests"
+    echo "  pip install requests orjson"
     exit 1
 }
 
@@ -57,7 +57,8 @@ mkdir -p data/submissions
 echo "Starting bulk download..."
 echo "Settings:"
 echo "  - Workers: 10 (concurrent downloads)"
-echo "  - Delay: 2 seconds (between downloads)"
+echo "  - Rate limit: 9 requests/second (shared across workers)"
+echo "  - Retry delay: 2 seconds"
 echo "  - Retry attempts: 3"
 echo "  - Output directory: data/submissions"
 echo ""
@@ -46,10 +46,10 @@ source venv/bin/activate
 
 # Check if required packages are installed
 echo -e "${YELLOW}🔍 Checking dependencies...${NC}"
-python -c "import sec_edgar_downloader, dotenv" 2>/dev/null || {
+python -c "import requests, orjson, dotenv" 2>/dev/null || {
     echo -e "${RED}❌ Required packages not installed${NC}"
     echo -e "${YELLOW}Installing dependencies...${NC}"
-    pip install sec-edgar-downloader python-dotenv
+    pip install requests orjson python-dotenv
 }
 
 # Parse command line arguments
@@ -74,8 +74,8 @@ echo -e "${GREEN}✅ Download script completed!${NC}"
 echo -e "${BLUE}📁 Data saved in: $PROJECT_ROOT/data/raw${NC}"
 echo ""
 echo -e "${YELLOW}Usage:${NC}"
-echo "  ./scripts/bash/download_data.sh          # Normal download (skip existing)"
-echo "  ./scripts/bash/download_data.sh --force  # Force re-download all data"
+echo "  ./scripts/bash/download_data.sh          # Normal download (only new filings)"
+echo "  ./scripts/bash/download_data.sh --force  # Force re-download all filings"
 echo ""
 echo -e "${YELLOW}Next steps:${NC}"
 echo "  1. Start backend: cd backend && python main.py"
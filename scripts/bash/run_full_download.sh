@@ -141,7 +141,7 @@ show_usage() {
     echo "  1. Activate virtual environment (if available)"
     echo "  2. Download all CIKs to data/submissions/$TODAY/CIK/*/"
     echo "  3. Generate status report at data/submissions/$TODAY/$TODAY.md"
-    echo "  4. Use 10 concurrent workers with 1-second delays"
+    echo "  4. Use 10 concurrent workers sharing a 9 requests/second rate limit"
     echo "  5. Retry failed downloads up to 3 times"
 }
 
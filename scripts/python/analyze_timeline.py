@@ -5,15 +5,57 @@ Analyzes SEC filings to create intelligent timelines and insights.
 """
 
 import os
-import json
+import sys
 import time
+import queue
+import atexit
+import logging
+import heapq
+import hashlib
+import sqlite3
+import threading
+import orjson
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from concurrent.futures import ThreadPoolExecutor
+from logging.handlers import QueueHandler, QueueListener
 from pathlib import Path
 from datetime import datetime
 from typing import List, Dict, Any
 from dotenv import load_dotenv
 
+# Log through a queue so worker threads never block on stdout; one listener thread does the writing
+_log_queue = queue.Queue(-1)
+_log_handler = logging.StreamHandler(sys.stdout)
+_log_handler.setFormatter(logging.Formatter('%(message)s'))
+_log_listener = QueueListener(_log_queue, _log_handler)
+_log_listener.start()
+atexit.register(_log_listener.stop)
+
+logger = logging.getLogger('analyze_timeline')
+logger.addHandler(QueueHandler(_log_queue))
+logger.setLevel(logging.INFO)
+logger.propagate = False
+
 class DeepSeekTimelineAnalyzer:
+    # Prompt pieces shared by every API call, built once at import time
+    SYSTEM_MESSAGE = {
+        "role": "system",
+        "content": "You are a financial analyst expert in SEC filings analysis. Provide detailed, accurate, and insightful analysis of SEC filings to create comprehensive timelines and identify key business events, financial trends, and strategic decisions."
+    }
+    
+    FILING_PREVIEW_TEMPLATE = """Form Type: {form}
+Filing Date: {filing_date}
+Content Preview: {content}
+"""
+    
+    SUMMARY_POINTS = """1. Key business events or announcements
+2. Financial highlights or concerns
+3. Strategic decisions or changes
+4. Regulatory or compliance matters
+5. Impact on investors or stakeholders"""
+    
     def __init__(self):
         # Load environment variables
         load_dotenv()
@@ -24,122 +66,254 @@ class DeepSeekTimelineAnalyzer:
             raise ValueError("DEEPSEEK_API_KEY not found in environment variables")
         self.api_url = "https://api.deepseek.com/v1/chat/completions"
         
+        # Reuse one session so every API call shares the same keep-alive connection
+        self.backoff_factor = float(os.getenv('DEEPSEEK_BACKOFF_FACTOR', '0.1'))
+        retry = Retry(
+            total=3,
+            backoff_factor=self.backoff_factor,
+            status_forcelist=[429, 500, 502, 503, 504],
+            allowed_methods=["POST"]
+        )
+        adapter = HTTPAdapter(pool_connections=10, pool_maxsize=10, max_retries=retry)
+        self.session = requests.Session()
+        self.session.mount("https://", adapter)
+        self.session.headers.update({
+            "Authorization": f"Bearer {self.api_key}",
+            "Content-Type": "application/json"
+        })
+        
+        # Request fields that are the same for every call
+        self.base_payload = {
+            "model": "deepseek-chat",
+            "temperature": 0.3,
+            "stream": True
+        }
+        
+        # Maximum number of DeepSeek requests in flight at once
+        self.max_concurrent_requests = int(os.getenv('DEEPSEEK_MAX_CONCURRENCY', '5'))
+        
+        # Filings summarized per API request (keeps the prompt well under the model context)
+        self.summary_batch_size = int(os.getenv('DEEPSEEK_SUMMARY_BATCH_SIZE', '5'))
+        
         # Set up directories
         self.base_dir = Path(__file__).parent.parent.parent
         self.raw_data_dir = self.base_dir / 'data' / 'raw'
         self.analysis_dir = self.base_dir / 'data' / 'analysis'
         self.analysis_dir.mkdir(parents=True, exist_ok=True)
         
-        print(f"🤖 DeepSeek Timeline Analyzer initialized")
-        print(f"📁 Raw data directory: {self.raw_data_dir}")
-        print(f"📊 Analysis directory: {self.analysis_dir}")
+        # Cache filing summaries so re-runs don't re-bill the API for unchanged filings
+        self.cache_lock = threading.Lock()
+        self.cache = sqlite3.connect(self.analysis_dir / '_summary_cache.sqlite',
+                                     isolation_level=None, check_same_thread=False)
+        self.cache.execute("PRAGMA journal_mode=WAL")
+        self.cache.execute("CREATE TABLE IF NOT EXISTS cache(key TEXT PRIMARY KEY, summary TEXT, ts REAL)")
+        
+        logger.info(f"🤖 DeepSeek Timeline Analyzer initialized")
+        logger.info(f"📁 Raw data directory: {self.raw_data_dir}")
+        logger.info(f"📊 Analysis directory: {self.analysis_dir}")
     
     def load_tickers(self):
         """Load ticker symbols from tickers.json"""
         tickers_file = self.base_dir / 'tickers.json'
         try:
-            with open(tickers_file, 'r') as f:
-                tickers = json.load(f)
-            print(f"✅ Loaded {len(tickers)} tickers: {', '.join(tickers)}")
+            tickers = orjson.loads(tickers_file.read_bytes())
+            logger.info(f"✅ Loaded {len(tickers)} tickers: {', '.join(tickers)}")
             return tickers
         except FileNotFoundError:
-            print(f"❌ Error: {tickers_file} not found")
+            logger.error(f"❌ Error: {tickers_file} not found")
             return []
-        except json.JSONDecodeError as e:
-            print(f"❌ Error parsing {tickers_file}: {e}")
+        except orjson.JSONDecodeError as e:
+            logger.error(f"❌ Error parsing {tickers_file}: {e}")
             return []
     
     def load_filings_for_ticker(self, ticker: str) -> List[Dict[str, Any]]:
-        """Load all SEC filings for a specific ticker"""
+        """Load all SEC filings for a specific ticker (unordered)"""
         ticker_dir = self.raw_data_dir / ticker
         if not ticker_dir.exists():
-            print(f"❌ No data found for {ticker}")
+            logger.error(f"❌ No data found for {ticker}")
             return []
         
         filings = []
-        json_files = [f for f in ticker_dir.glob('*.json') if f.name != 'timeline_summary.json']
-        
-        for json_file in json_files:
-            try:
-                with open(json_file, 'r', encoding='utf-8') as f:
-                    filing_data = json.load(f)
-                filings.append(filing_data)
-            except Exception as e:
-                print(f"⚠️  Error reading {json_file.name}: {e}")
-        
-        # Sort by filing date
-        filings.sort(key=lambda x: x.get('filing_date', ''), reverse=True)
-        print(f"📄 Loaded {len(filings)} filings for {ticker}")
+        filings_file = ticker_dir / 'filings.ndjson'
+        
+        if filings_file.exists():
+            # Aggregated newline-delimited file written by download_data.py
+            with open(filings_file, 'rb') as f:
+                for line_number, line in enumerate(f, 1):
+                    if not line.strip():
+                        continue
+                    try:
+                        filings.append(orjson.loads(line))
+                    except orjson.JSONDecodeError as e:
+                        logger.warning(f"⚠️  Error reading {filings_file.name} line {line_number}: {e}")
+        else:
+            # Legacy layout: one JSON file per filing
+            with os.scandir(ticker_dir) as entries:
+                json_files = [entry for entry in entries
+                              if entry.name.endswith('.json') and entry.name != 'timeline_summary.json'
+                              and entry.is_file(follow_symlinks=False)]
+            
+            for json_file in json_files:
+                try:
+                    with open(json_file.path, 'rb') as f:
+                        filings.append(orjson.loads(f.read()))
+                except Exception as e:
+                    logger.warning(f"⚠️  Error reading {json_file.name}: {e}")
+        
+        logger.info(f"📄 Loaded {len(filings)} filings for {ticker}")
         return filings
     
     def call_deepseek_api(self, prompt: str, max_tokens: int = 2000) -> str:
         """Make API call to DeepSeek"""
-        headers = {
-            "Authorization": f"Bearer {self.api_key}",
-            "Content-Type": "application/json"
-        }
-        
         data = {
-            "model": "deepseek-chat",
-            "messages": [
-                {
-                    "role": "system",
-                    "content": "You are a financial analyst expert in SEC filings analysis. Provide detailed, accurate, and insightful analysis of SEC filings to create comprehensive timelines and identify key business events, financial trends, and strategic decisions."
-                },
-                {
-                    "role": "user",
-                    "content": prompt
-                }
-            ],
-            "max_tokens": max_tokens,
-            "temperature": 0.3,
-            "stream": False
+            **self.base_payload,
+            "messages": [self.SYSTEM_MESSAGE, {"role": "user", "content": prompt}],
+            "max_tokens": max_tokens
         }
         
         try:
-            response = requests.post(self.api_url, headers=headers, json=data, timeout=60)
-            response.raise_for_status()
+            # Stream the completion and collect content deltas as they arrive
+            with self.session.post(self.api_url, data=orjson.dumps(data), timeout=60, stream=True) as response:
+                response.raise_for_status()
+                
+                chunks = []
+                for line in response.iter_lines():
+                    if not line.startswith(b'data: '):
+                        continue  # Skip keep-alive blank lines and SSE comments
+                    payload = line[6:]
+                    if payload == b'[DONE]':
+                        break
+                    # Skip a malformed or empty chunk rather than discarding everything streamed so far
+                    try:
+                        choices = orjson.loads(payload).get('choices') or []
+                    except orjson.JSONDecodeError:
+                        logger.warning(f"⚠️  Skipping malformed stream chunk: {payload[:100]!r}")
+                        continue
+                    if not choices:
+                        continue
+                    delta = choices[0].get('delta') or {}
+                    chunks.append(delta.get('content') or '')
             
-            result = response.json()
-            return result['choices'][0]['message']['content']
+            return ''.join(chunks)
             
         except requests.exceptions.RequestException as e:
-            print(f"❌ API request failed: {e}")
+            logger.error(f"❌ API request failed: {e}")
             return f"Error: API request failed - {e}"
-        except KeyError as e:
-            print(f"❌ Unexpected API response format: {e}")
+        except (KeyError, IndexError, orjson.JSONDecodeError) as e:
+            logger.error(f"❌ Unexpected API response format: {e}")
             return f"Error: Unexpected API response format - {e}"
     
+    def summary_cache_key(self, filing: Dict[str, Any]) -> str:
+        """Hash the parts of a filing that go into its summary prompt"""
+        key_source = (filing.get('content', '')[:3000] + filing.get('form', 'Unknown') + filing.get('filing_date', 'Unknown'))
+        return hashlib.sha256(key_source.encode('utf-8')).hexdigest()
+    
+    def timeline_cache_key(self, ticker: str, filings: List[Dict[str, Any]]) -> str:
+        """Hash the ticker and the summary keys of every filing that goes into the timeline prompt"""
+        key_source = ticker + ''.join(self.summary_cache_key(filing) for filing in filings)
+        return hashlib.sha256(key_source.encode('utf-8')).hexdigest()
+    
+    def get_cached(self, key: str):
+        """Return the cached value for a key, or None"""
+        with self.cache_lock:
+            row = self.cache.execute("SELECT summary FROM cache WHERE key=?", (key,)).fetchone()
+        return row[0] if row else None
+    
+    def put_cached(self, key: str, value: str):
+        """Insert or replace a cached value"""
+        with self.cache_lock:
+            self.cache.execute("INSERT OR REPLACE INTO cache(key, summary, ts) VALUES (?, ?, ?)",
+                               (key, value, time.time()))
+    
+    def get_cached_summary(self, filing: Dict[str, Any]):
+        """Return the cached summary for a filing, or None"""
+        return self.get_cached(self.summary_cache_key(filing))
+    
+    def store_summary(self, filing: Dict[str, Any], summary: str):
+        """Cache a successful summary (API errors and empty replies are not cached)"""
+        if not summary.strip() or summary.startswith("Error:"):
+            return
+        self.put_cached(self.summary_cache_key(filing), summary)
+    
+    def format_filing_preview(self, filing: Dict[str, Any]) -> str:
+        """Render the form/date/content block used in summary prompts"""
+        return self.FILING_PREVIEW_TEMPLATE.format(
+            form=filing.get('form', 'Unknown'),
+            filing_date=filing.get('filing_date', 'Unknown'),
+            content=filing.get('content', '')[:3000]  # Limit content for API
+        )
+    
     def create_filing_summary(self, filing: Dict[str, Any]) -> str:
         """Create a summary of a single filing using DeepSeek API"""
-        content = filing.get('content', '')[:3000]  # Limit content for API
-        form_type = filing.get('form', 'Unknown')
-        filing_date = filing.get('filing_date', 'Unknown')
-        
         prompt = f"""
 Analyze this SEC filing and provide a concise summary:
 
-Form Type: {form_type}
-Filing Date: {filing_date}
-Content Preview: {content}
-
+{self.format_filing_preview(filing)}
 Please provide:
-1. Key business events or announcements
-2. Financial highlights or concerns
-3. Strategic decisions or changes
-4. Regulatory or compliance matters
-5. Impact on investors or stakeholders
+{self.SUMMARY_POINTS}
 
 Keep the summary concise but informative (max 200 words).
 """
         
         return self.call_deepseek_api(prompt, max_tokens=300)
     
+    def create_filing_summaries_batch(self, filings: List[Dict[str, Any]]) -> List[str]:
+        """Summarize several filings with a single DeepSeek API call"""
+        if len(filings) == 1:
+            return [self.create_filing_summary(filings[0])]
+        
+        filing_sections = []
+        for i, filing in enumerate(filings, 1):
+            filing_sections.append(f"Filing {i}:\n{self.format_filing_preview(filing)}")
+        filings_text = "\n".join(filing_sections)
+        
+        prompt = f"""
+Analyze each of the following {len(filings)} SEC filings and provide a concise summary for each one.
+
+{filings_text}
+For each filing, please cover:
+{self.SUMMARY_POINTS}
+
+Keep each summary concise but informative (max 200 words).
+Return only a JSON array of {len(filings)} strings, where element i is the summary of Filing i+1.
+"""
+        
+        response = self.call_deepseek_api(prompt, max_tokens=300 * len(filings))
+        
+        # The API itself failed; retrying per filing would only repeat the failure len(filings) times
+        if response.startswith("Error:"):
+            return [response] * len(filings)
+        
+        # Try to parse the JSON array, falling back to one request per filing
+        try:
+            json_start = response.find('[')
+            json_end = response.rfind(']') + 1
+            summaries = orjson.loads(response[json_start:json_end])
+            if (isinstance(summaries, list) and len(summaries) == len(filings)
+                    and all(isinstance(summary, str) for summary in summaries)):
+                return summaries
+            logger.warning(f"⚠️  Batched summary returned {len(summaries) if isinstance(summaries, list) else 'no'} items, expected {len(filings)}")
+        except orjson.JSONDecodeError as e:
+            logger.warning(f"⚠️  Could not parse batched summary response: {e}")
+        
+        logger.info(f"  Falling back to individual summaries...")
+        with ThreadPoolExecutor(max_workers=self.max_concurrent_requests) as executor:
+            return list(executor.map(self.create_filing_summary, filings))
+    
     def create_comprehensive_timeline(self, ticker: str, filings: List[Dict[str, Any]]) -> Dict[str, Any]:
         """Create a comprehensive timeline analysis using DeepSeek API"""
+        filings = filings[:10]  # Limit to most recent 10 filings
+        
+        # The timeline is the most expensive call, so reuse it while none of its input filings changed
+        cache_key = self.timeline_cache_key(ticker, filings)
+        cached = self.get_cached(cache_key)
+        if cached is not None:
+            logger.info(f"  💾 Using cached timeline for {ticker}")
+            return orjson.loads(cached)
+        
         # Prepare filing summaries for context
         filing_summaries = []
-        for filing in filings[:10]:  # Limit to most recent 10 filings
+        for filing in filings:
             summary = {
                 'form': filing.get('form', 'Unknown'),
                 'date': filing.get('filing_date', 'Unknown'),
@@ -151,7 +325,7 @@ Keep the summary concise but informative (max 200 words).
 Analyze the following SEC filings for {ticker} and create a comprehensive business timeline:
 
 Filings Data:
-{json.dumps(filing_summaries, indent=2)}
+{orjson.dumps(filing_summaries, option=orjson.OPT_INDENT_2).decode()}
 
 Please provide a detailed analysis in JSON format with the following structure:
 {{
@@ -201,11 +375,13 @@ Ensure the JSON is valid and comprehensive.
             else:
                 json_str = response
             
-            timeline_data = json.loads(json_str)
+            timeline_data = orjson.loads(json_str)
+            # Only parsed timelines are cached; the fallback below is retried on the next run
+            self.put_cached(cache_key, orjson.dumps(timeline_data).decode())
             return timeline_data
             
-        except json.JSONDecodeError as e:
-            print(f"⚠️  Could not parse JSON response for {ticker}: {e}")
+        except orjson.JSONDecodeError as e:
+            logger.warning(f"⚠️  Could not parse JSON response for {ticker}: {e}")
             # Return a fallback structure
             return {
                 "company_overview": f"Analysis for {ticker}",
@@ -218,33 +394,54 @@ Ensure the JSON is valid and comprehensive.
                 "raw_response": response
             }
     
-    def analyze_ticker(self, ticker: str) -> bool:
-        """Analyze all filings for a specific ticker"""
-        print(f"\n🔍 Analyzing {ticker}...")
+    def analyze_ticker(self, ticker: str, filings: List[Dict[str, Any]] = None) -> bool:
+        """Analyze all filings for a specific ticker (filings may be preloaded by the caller)"""
+        logger.info(f"\n🔍 Analyzing {ticker}...")
         
         # Load filings
-        filings = self.load_filings_for_ticker(ticker)
+        if filings is None:
+            filings = self.load_filings_for_ticker(ticker)
         if not filings:
-            print(f"⚠️  No filings found for {ticker}")
+            logger.warning(f"⚠️  No filings found for {ticker}")
             return False
         
-        # Create individual filing summaries
-        print(f"📝 Creating filing summaries...")
+        # Only the 10 most recent filings are used, so select them instead of sorting everything
+        latest_filings = heapq.nlargest(10, filings, key=lambda x: x.get('filing_date', ''))
+        
+        # Create individual filing summaries concurrently - each call is dominated by API latency
+        logger.info(f"📝 Creating filing summaries...")
+        recent_filings = latest_filings[:5]  # Limit to 5 most recent for detailed analysis
+        for i, filing in enumerate(recent_filings):
+            logger.info(f"  Processing filing {i+1}/{len(recent_filings)}: {filing.get('form', 'Unknown')}")
+        
+        # Reuse cached summaries and only send the remaining filings to the API
+        summaries = [self.get_cached_summary(filing) for filing in recent_filings]
+        uncached_filings = [filing for filing, summary in zip(recent_filings, summaries) if summary is None]
+        if len(uncached_filings) < len(recent_filings):
+            logger.info(f"  💾 Using {len(recent_filings) - len(uncached_filings)} cached summaries")
+        
+        # Coalesce filings into batched prompts; batches themselves run concurrently
+        batches = [uncached_filings[i:i + self.summary_batch_size]
+                   for i in range(0, len(uncached_filings), self.summary_batch_size)]
+        with ThreadPoolExecutor(max_workers=self.max_concurrent_requests) as executor:
+            new_summaries = iter([summary
+                                  for batch_summaries in executor.map(self.create_filing_summaries_batch, batches)
+                                  for summary in batch_summaries])
+        
+        for i, filing in enumerate(recent_filings):
+            if summaries[i] is None:
+                summaries[i] = next(new_summaries)
+                self.store_summary(filing, summaries[i])
+        
         enhanced_filings = []
-        for i, filing in enumerate(filings[:5]):  # Limit to 5 most recent for detailed analysis
-            print(f"  Processing filing {i+1}/5: {filing.get('form', 'Unknown')}")
-            summary = self.create_filing_summary(filing)
-            
+        for filing, summary in zip(recent_filings, summaries):
             enhanced_filing = filing.copy()
             enhanced_filing['ai_summary'] = summary
             enhanced_filings.append(enhanced_filing)
-            
-            # Rate limiting
-            time.sleep(2)
         
         # Create comprehensive timeline
-        print(f"🕒 Creating comprehensive timeline...")
-        timeline_analysis = self.create_comprehensive_timeline(ticker, filings)
+        logger.info(f"🕒 Creating comprehensive timeline...")
+        timeline_analysis = self.create_comprehensive_timeline(ticker, latest_filings)
         
         # Combine all analysis
         complete_analysis = {
@@ -262,16 +459,15 @@ Ensure the JSON is valid and comprehensive.
         
         # Save analysis
         analysis_file = self.analysis_dir / f"{ticker}_timeline_analysis.json"
-        with open(analysis_file, 'w', encoding='utf-8') as f:
-            json.dump(complete_analysis, f, indent=2, ensure_ascii=False)
+        analysis_file.write_bytes(orjson.dumps(complete_analysis, option=orjson.OPT_INDENT_2))
         
-        print(f"✅ Analysis completed for {ticker}")
-        print(f"📊 Saved to: {analysis_file}")
+        logger.info(f"✅ Analysis completed for {ticker}")
+        logger.info(f"📊 Saved to: {analysis_file}")
         return True
     
     def create_summary_report(self, analyzed_tickers: List[str]):
         """Create a summary report of all analyzed tickers"""
-        print(f"\n📋 Creating summary report...")
+        logger.info(f"\n📋 Creating summary report...")
         
         summary_data = {
             "report_date": datetime.now().isoformat(),
@@ -282,52 +478,66 @@ Ensure the JSON is valid and comprehensive.
         }
         
         summary_file = self.analysis_dir / "analysis_summary.json"
-        with open(summary_file, 'w', encoding='utf-8') as f:
-            json.dump(summary_data, f, indent=2, ensure_ascii=False)
+        summary_file.write_bytes(orjson.dumps(summary_data, option=orjson.OPT_INDENT_2))
         
-        print(f"📊 Summary report saved to: {summary_file}")
+        logger.info(f"📊 Summary report saved to: {summary_file}")
     
     def run(self):
         """Main execution method"""
-        print("🚀 Starting SEC filing timeline analysis...\n")
-        
-        # Load tickers
-        tickers = self.load_tickers()
-        if not tickers:
-            print("❌ No tickers to analyze")
-            return
+        logger.info("🚀 Starting SEC filing timeline analysis...\n")
         
-        # Analyze each ticker
+        # Analyze each ticker, loading the next ticker's filings in the background
         successful_analyses = []
-        for ticker in tickers:
-            try:
-                if self.analyze_ticker(ticker):
-                    successful_analyses.append(ticker)
-                    print(f"✅ {ticker} analysis completed")
-                else:
-                    print(f"⚠️  {ticker} analysis skipped")
-            except Exception as e:
-                print(f"❌ Error analyzing {ticker}: {e}")
+        try:
+            # Load tickers
+            tickers = self.load_tickers()
+            if not tickers:
+                logger.error("❌ No tickers to analyze")
+                return
             
-            # Rate limiting between tickers
-            if ticker != tickers[-1]:  # Don't sleep after last ticker
-                print("⏳ Waiting 5 seconds before next ticker...")
-                time.sleep(5)
+            with ThreadPoolExecutor(max_workers=1) as prefetcher:
+                next_filings = prefetcher.submit(self.load_filings_for_ticker, tickers[0])
+                for i, ticker in enumerate(tickers):
+                    try:
+                        filings = next_filings.result()
+                    except Exception as e:
+                        logger.warning(f"⚠️  Error loading filings for {ticker}: {e}")
+                        filings = []
+                    
+                    if i + 1 < len(tickers):
+                        next_filings = prefetcher.submit(self.load_filings_for_ticker, tickers[i + 1])
+                    
+                    try:
+                        if self.analyze_ticker(ticker, filings):
+                            successful_analyses.append(ticker)
+                            logger.info(f"✅ {ticker} analysis completed")
+                        else:
+                            logger.warning(f"⚠️  {ticker} analysis skipped")
+                    except Exception as e:
+                        logger.error(f"❌ Error analyzing {ticker}: {e}")
+                    
+                    # Rate limiting between tickers
+                    if i + 1 < len(tickers):  # Don't sleep after last ticker
+                        logger.info("⏳ Waiting 5 seconds before next ticker...")
+                        time.sleep(5)
+        finally:
+            # WAL mode keeps -wal/-shm side files until the connection is closed
+            self.cache.close()
         
         # Create summary report
         if successful_analyses:
             self.create_summary_report(successful_analyses)
         
-        print("\n" + "="*60)
-        print(f"🎉 Timeline analysis completed!")
-        print(f"📊 Successfully analyzed: {len(successful_analyses)}/{len(tickers)} tickers")
-        print(f"📁 Analysis files saved in: {self.analysis_dir}")
-        print("\n📋 Generated files:")
+        logger.info("\n" + "="*60)
+        logger.info(f"🎉 Timeline analysis completed!")
+        logger.info(f"📊 Successfully analyzed: {len(successful_analyses)}/{len(tickers)} tickers")
+        logger.info(f"📁 Analysis files saved in: {self.analysis_dir}")
+        logger.info("\n📋 Generated files:")
         for ticker in successful_analyses:
-            print(f"  • {ticker}_timeline_analysis.json")
+            logger.info(f"  • {ticker}_timeline_analysis.json")
         if successful_analyses:
-            print(f"  • analysis_summary.json")
-        print("\n💡 Use these analysis files to gain insights into company timelines and trends!")
+            logger.info(f"  • analysis_summary.json")
+        logger.info("\n💡 Use these analysis files to gain insights into company timelines and trends!")
 
 if __name__ == "__main__":
     analyzer = DeepSeekTimelineAnalyzer()
@@ -15,11 +15,48 @@ Usage:
 
 import json
 import csv
+import heapq
 import argparse
+import os
+import pickle
 import sys
+import orjson
+from itertools import islice
+from operator import itemgetter
 from pathlib import Path
-from typing import List, Dict, Optional
-import re
+from typing import List, Dict, Optional, Tuple
+
+# Bump when the layout of the pickled state changes
+CACHE_VERSION = 2
+
+# Keys a download_summary.json must carry to answer --stats on its own
+STATISTICS_KEYS = ('total_companies', 'companies_with_tickers', 'companies_without_tickers',
+                   'last_updated', 'sample_tickers')
+
+def read_summary_statistics(data_dir="../../../data/cik_database") -> Optional[Dict]:
+    """
+    Read database statistics from download_summary.json without loading the database.
+    
+    Args:
+        data_dir (str): Directory containing the CIK database files
+        
+    Returns:
+        dict: Database statistics, or None if the summary is missing, stale or incomplete
+    """
+    data_dir = Path(__file__).parent / data_dir
+    summary_file = data_dir / "download_summary.json"
+    json_file = data_dir / "cik_database.json"
+    
+    try:
+        if summary_file.stat().st_mtime < json_file.stat().st_mtime:
+            return None
+        summary = orjson.loads(summary_file.read_bytes())
+    except (OSError, orjson.JSONDecodeError):
+        return None
+    
+    if not all(key in summary for key in STATISTICS_KEYS):
+        return None
+    return {key: summary[key] for key in STATISTICS_KEYS}
 
 class CIKLookup:
     def __init__(self, data_dir="../../../data/cik_database"):
@@ -31,27 +68,153 @@ class CIKLookup:
         """
         self.data_dir = Path(__file__).parent / data_dir
         self.companies = []
+        
+        # Struct-of-arrays search columns, aligned with self.companies
+        self._tickers_l = []
+        self._names_l = []
+        self._names_spaced = []
+        
+        # Hash indexes mapping normalized keys to company positions
+        self._by_ticker = {}
+        self._by_cik = {}
+        self._gram_index = None  # Built lazily on the first name/fuzzy search
+        self._statistics = None  # Computed on first request; the data is read-only after load
         self.load_data()
     
     def load_data(self):
         """
-        Load the CIK database from JSON file.
+        Load the CIK database, preferring the pickle cache when it is up to date.
+        
+        The cache holds the companies, search columns and hash indexes, so warm
+        starts skip both the JSON parse and the index build.
         """
         json_file = self.data_dir / "cik_database.json"
+        cache_file = self.data_dir / "cik_database.pkl"
         
         if not json_file.exists():
             print(f"Error: CIK database not found at {json_file}")
             print("Please run the download script first: download_cik_data.py")
             sys.exit(1)
         
+        if self._load_cache(cache_file, json_file):
+            return
+        
         try:
-            with open(json_file, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-                self.companies = data.get('companies', [])
-                self.metadata = data.get('metadata', {})
+            data = orjson.loads(json_file.read_bytes())
+            self.companies = data.get('companies', [])
+            self.metadata = data.get('metadata', {})
         except Exception as e:
             print(f"Error loading CIK database: {e}")
             sys.exit(1)
+        
+        self._build_indexes()
+        self._save_cache(cache_file)
+    
+    def _load_cache(self, cache_file: Path, json_file: Path) -> bool:
+        """
+        Load companies and indexes from the pickle cache if it is newer than the JSON.
+        
+        Returns:
+            bool: True if the cache was loaded
+        """
+        try:
+            if cache_file.stat().st_mtime < json_file.stat().st_mtime:
+                return False
+            with open(cache_file, 'rb') as f:
+                version, state = pickle.load(f)
+            if version != CACHE_VERSION:
+                return False
+            (self.companies, self._tickers_l, self._names_l, self._names_spaced,
+             self._by_ticker, self._by_cik, self.metadata) = state
+            return True
+        except (OSError, pickle.UnpicklingError, EOFError, ValueError, TypeError):
+            # Missing, stale or unreadable cache - rebuild from JSON
+            return False
+    
+    def _save_cache(self, cache_file: Path):
+        """
+        Write companies and indexes to the pickle cache (best effort).
+        """
+        tmp_file = cache_file.with_suffix('.pkl.tmp')
+        try:
+            with open(tmp_file, 'wb') as f:
+                state = (self.companies, self._tickers_l, self._names_l, self._names_spaced,
+                         self._by_ticker, self._by_cik, self.metadata)
+                pickle.dump((CACHE_VERSION, state), f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_file, cache_file)
+        except OSError:
+            # A read-only data directory just means no cache
+            pass
+    
+    def _build_indexes(self):
+        """
+        Build the normalized search columns and the ticker and CIK hash indexes.
+        
+        Searches scan only the columns they need instead of every company dict.
+        The first company seen for a key wins, matching the old linear scan.
+        """
+        self._tickers_l = [company.get('ticker', '').strip().lower() for company in self.companies]
+        self._names_l = [company.get('company_name', '').strip().lower() for company in self.companies]
+        # Words joined by single spaces behind a leading space, so " query" finds word prefixes
+        self._names_spaced = [' ' + ' '.join(name.split()) for name in self._names_l]
+        
+        self._by_ticker = {}
+        self._by_cik = {}
+        
+        for idx, company in enumerate(self.companies):
+            ticker = self._tickers_l[idx].upper()
+            if ticker:
+                self._by_ticker.setdefault(ticker, idx)
+            
+            # Normalize cik_raw to a plain int once (older databases may hold strings)
+            cik_raw = company.get('cik_raw', '')
+            if not isinstance(cik_raw, int):
+                if not str(cik_raw).isdigit():
+                    continue
+                cik_raw = company['cik_raw'] = int(cik_raw)
+            self._by_cik.setdefault(cik_raw, idx)
+    
+    @staticmethod
+    def _bigrams(text: str) -> set:
+        """Return the set of 2-character substrings of text."""
+        return {text[i:i + 2] for i in range(len(text) - 1)}
+    
+    def _build_gram_index(self):
+        """
+        Build a bigram -> company index posting list over lowercased tickers and names.
+        """
+        self._gram_index = {}
+        for idx, (ticker, name) in enumerate(zip(self._tickers_l, self._names_l)):
+            for gram in self._bigrams(ticker) | self._bigrams(name):
+                self._gram_index.setdefault(gram, []).append(idx)
+    
+    def _candidate_indices(self, query: str):
+        """
+        Find companies whose ticker or name could contain the query.
+        
+        Every bigram of a substring match must appear in the company's bigram set,
+        so intersecting the query's posting lists gives a superset of the matches.
+        
+        Args:
+            query (str): Lowercased search query
+            
+        Returns:
+            Sorted company indexes to check (every index for queries under two characters)
+        """
+        if len(query) < 2:
+            return range(len(self.companies))
+        
+        if self._gram_index is None:
+            self._build_gram_index()
+        
+        postings = sorted((self._gram_index.get(gram, ()) for gram in self._bigrams(query)), key=len)
+        candidates = set(postings[0])
+        for posting in postings[1:]:
+            if not candidates:
+                break
+            candidates.intersection_update(posting)
+        
+        return sorted(candidates)
     
     def lookup_by_ticker(self, ticker: str) -> Optional[Dict]:
         """
@@ -63,11 +226,8 @@ class CIKLookup:
         Returns:
             dict: Company information or None if not found
         """
-        ticker = ticker.upper().strip()
-        for company in self.companies:
-            if company.get('ticker', '').upper() == ticker:
-                return company
-        return None
+        idx = self._by_ticker.get(ticker.upper().strip())
+        return self.companies[idx] if idx is not None else None
     
     def lookup_by_cik(self, cik: str) -> Optional[Dict]:
         """
@@ -79,14 +239,14 @@ class CIKLookup:
         Returns:
             dict: Company information or None if not found
         """
-        # Normalize CIK (remove leading zeros for comparison)
-        cik_normalized = str(int(cik)) if cik.isdigit() else cik
+        # Normalize CIK (int() drops leading zeros)
+        try:
+            cik_normalized = int(cik)
+        except ValueError:
+            return None
         
-        for company in self.companies:
-            company_cik = str(int(company.get('cik_raw', 0))) if str(company.get('cik_raw', '')).isdigit() else ''
-            if company_cik == cik_normalized:
-                return company
-        return None
+        idx = self._by_cik.get(cik_normalized)
+        return self.companies[idx] if idx is not None else None
     
     def search_by_name(self, name: str, exact_match: bool = False) -> List[Dict]:
         """
@@ -102,19 +262,21 @@ class CIKLookup:
         name = name.lower().strip()
         matches = []
         
-        for company in self.companies:
-            company_name = company.get('company_name', '').lower()
+        names_l = self._names_l
+        
+        for idx in self._candidate_indices(name):
+            company_name = names_l[idx]
             
             if exact_match:
                 if company_name == name:
-                    matches.append(company)
+                    matches.append(self.companies[idx])
             else:
                 if name in company_name:
-                    matches.append(company)
+                    matches.append(self.companies[idx])
         
         return matches
     
-    def fuzzy_search(self, query: str, limit: int = 10) -> List[Dict]:
+    def fuzzy_search(self, query: str, limit: int = 10) -> List[Tuple[int, Dict]]:
         """
         Perform fuzzy search across ticker and company name.
         
@@ -123,14 +285,17 @@ class CIKLookup:
             limit (int): Maximum number of results
             
         Returns:
-            list: List of matching companies
+            list: (score, company) pairs, best match first
         """
         query = query.lower().strip()
-        matches = []
+        word_prefix = ' ' + query
+        query_is_word = len(query.split()) == 1  # Only whitespace-free queries can prefix a word
+        scored = []  # (score, index) pairs; result dicts are built only for the top hits
+        tickers_l, names_l, names_spaced = self._tickers_l, self._names_l, self._names_spaced
         
-        for company in self.companies:
-            ticker = company.get('ticker', '').lower()
-            name = company.get('company_name', '').lower()
+        for idx in self._candidate_indices(query):
+            ticker = tickers_l[idx]
+            name = names_l[idx]
             
             # Score based on relevance
             score = 0
@@ -141,30 +306,26 @@ class CIKLookup:
             elif query in ticker:
                 score = 80
             
-            # Name matches
-            if query in name:
+            # Name matches, each decided by one C-level string search
+            # (a match inside a word always implies a name match, so it never beats 50)
+            position = name.find(query)
+            if position == 0:
                 # Boost score if query is at the beginning of name
-                if name.startswith(query):
-                    score = max(score, 70)
+                score = max(score, 70)
+            elif position > 0:
+                # Word boundary matches in name rank above plain substring matches
+                if query_is_word and word_prefix in names_spaced[idx]:
+                    score = max(score, 60)
                 else:
                     score = max(score, 50)
             
-            # Word boundary matches in name
-            words = name.split()
-            for word in words:
-                if word.startswith(query):
-                    score = max(score, 60)
-                elif query in word:
-                    score = max(score, 40)
-            
             if score > 0:
-                company_with_score = company.copy()
-                company_with_score['_search_score'] = score
-                matches.append(company_with_score)
+                scored.append((score, idx))
         
-        # Sort by score (descending) and limit results
-        matches.sort(key=lambda x: x['_search_score'], reverse=True)
-        return matches[:limit]
+        # Take the top results by score (descending) without sorting every match;
+        # keying on the score alone keeps ties in database order
+        top = heapq.nlargest(limit, scored, key=itemgetter(0))
+        return [(score, self.companies[idx]) for score, idx in top]
     
     def get_statistics(self) -> Dict:
         """
@@ -173,20 +334,24 @@ class CIKLookup:
         Returns:
             dict: Database statistics
         """
-        total_companies = len(self.companies)
-        companies_with_tickers = len([c for c in self.companies if c.get('ticker')])
-        companies_without_tickers = total_companies - companies_with_tickers
-        
-        # Get some sample tickers
-        sample_tickers = [c['ticker'] for c in self.companies if c.get('ticker')][:10]
-        
-        return {
-            'total_companies': total_companies,
-            'companies_with_tickers': companies_with_tickers,
-            'companies_without_tickers': companies_without_tickers,
-            'last_updated': self.metadata.get('last_updated', 'Unknown'),
-            'sample_tickers': sample_tickers
-        }
+        if self._statistics is None:
+            total_companies = len(self.companies)
+            # Count in one pass without building a throwaway list of matches
+            companies_with_tickers = sum(1 for c in self.companies if c.get('ticker'))
+            companies_without_tickers = total_companies - companies_with_tickers
+            
+            # Get some sample tickers
+            sample_tickers = list(islice((c['ticker'] for c in self.companies if c.get('ticker')), 10))
+            
+            self._statistics = {
+                'total_companies': total_companies,
+                'companies_with_tickers': companies_with_tickers,
+                'companies_without_tickers': companies_without_tickers,
+                'last_updated': self.metadata.get('last_updated', 'Unknown'),
+                'sample_tickers': sample_tickers
+            }
+        
+        return dict(self._statistics)
     
     def format_company_info(self, company: Dict) -> str:
         """
@@ -239,10 +404,9 @@ Examples:
         parser.print_help()
         sys.exit(1)
     
-    lookup = CIKLookup()
-    
     if args.stats:
-        stats = lookup.get_statistics()
+        # Serve from the download summary when possible; loading the full database is the fallback
+        stats = read_summary_statistics() or CIKLookup().get_statistics()
         if args.json:
             print(json.dumps(stats, indent=2))
         else:
@@ -255,6 +419,7 @@ Examples:
             print(f"Sample Tickers: {', '.join(stats['sample_tickers'])}")
         return
     
+    lookup = CIKLookup()
     results = []
     
     if args.ticker:
@@ -271,16 +436,11 @@ Examples:
         results = lookup.search_by_name(args.name, exact_match=True)
     
     elif args.search:
-        results = lookup.fuzzy_search(args.search, limit=args.limit)
+        results = [company for score, company in lookup.fuzzy_search(args.search, limit=args.limit)]
     
     # Output results
     if args.json:
-        # Remove search scores from JSON output
-        clean_results = []
-        for result in results:
-            clean_result = {k: v for k, v in result.items() if not k.startswith('_')}
-            clean_results.append(clean_result)
-        print(json.dumps(clean_results, indent=2))
+        print(json.dumps(results, indent=2))
     else:
         if not results:
             print("No companies found matching your criteria.")
@@ -10,15 +10,19 @@ This data is updated regularly by the SEC.
 
 Usage:
     python download_cik_data.py
+    python download_cik_data.py --pretty
 
 Output:
-    - data/cik_database/company_tickers.json (raw SEC data)
+    - data/cik_database/company_tickers.json.gz (raw SEC data, gzip-compressed as served)
     - data/cik_database/cik_database.csv (processed CSV format)
     - data/cik_database/cik_database.json (processed JSON format)
 """
 
-import json
+import argparse
 import csv
+import gzip
+import orjson
+from itertools import islice
 import requests
 import os
 from datetime import datetime
@@ -38,15 +42,18 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 class CIKDownloader:
-    def __init__(self, data_dir="../../../data/cik_database"):
+    def __init__(self, data_dir="../../../data/cik_database", pretty=False):
         """
         Initialize the CIK downloader.
         
         Args:
             data_dir (str): Directory to save the downloaded data
+            pretty (bool): Indent cik_database.json for human inspection
         """
         self.data_dir = Path(__file__).parent / data_dir
         self.data_dir.mkdir(parents=True, exist_ok=True)
+        self.pretty = pretty
+        self.last_updated = 'Unknown'  # Set when cik_database.json is written
         
         # SEC EDGAR company tickers endpoint
         self.sec_url = "https://www.sec.gov/files/company_tickers.json"
@@ -54,9 +61,55 @@ class CIKDownloader:
         # Set headers to comply with SEC requirements
         self.headers = {
             'User-Agent': 'Edgar-Insights-Tool contact@example.com',
-            'Accept-Encoding': 'gzip, deflate',
+            'Accept-Encoding': 'gzip',  # Only gzip, so the compressed body can be stored as-is
             'Host': 'www.sec.gov'
         }
+        
+        # Raw SEC response, kept compressed; nothing downstream reads it except the 304 path
+        self.raw_file = self.data_dir / "company_tickers.json.gz"
+        
+        # ETag / Last-Modified of the last download, sent back so SEC can answer 304
+        self.http_cache_file = self.data_dir / ".http_cache.json"
+    
+    def load_http_cache(self):
+        """
+        Load the validators saved from the last successful download.
+        
+        Returns:
+            dict: Conditional request headers (empty if nothing is cached)
+        """
+        if not (self.raw_file.exists() and self.http_cache_file.exists()):
+            return {}
+        
+        try:
+            cached = orjson.loads(self.http_cache_file.read_bytes())
+        except (OSError, orjson.JSONDecodeError) as e:
+            logger.warning(f"Ignoring unreadable HTTP cache {self.http_cache_file}: {e}")
+            return {}
+        
+        headers = {}
+        if cached.get('etag'):
+            headers['If-None-Match'] = cached['etag']
+        if cached.get('last_modified'):
+            headers['If-Modified-Since'] = cached['last_modified']
+        return headers
+    
+    def save_http_cache(self, response):
+        """
+        Persist the response validators for the next conditional request.
+        
+        Args:
+            response (requests.Response): Successful response from SEC
+        """
+        etag = response.headers.get('ETag')
+        last_modified = response.headers.get('Last-Modified')
+        if not (etag or last_modified):
+            return
+        
+        self.http_cache_file.write_bytes(orjson.dumps({
+            'etag': etag,
+            'last_modified': last_modified
+        }))
     
     def download_raw_data(self):
         """
@@ -71,17 +124,30 @@ class CIKDownloader:
             # Add delay to be respectful to SEC servers
             time.sleep(0.1)
             
-            response = requests.get(self.sec_url, headers=self.headers, timeout=30)
+            headers = {**self.headers, **self.load_http_cache()}
+            
+            response = requests.get(self.sec_url, headers=headers, timeout=30, stream=True)
+            
+            if response.status_code == 304:
+                logger.info(f"SEC data unchanged, reusing cached {self.raw_file}")
+                data = orjson.loads(gzip.decompress(self.raw_file.read_bytes()))
+                logger.info(f"Loaded {len(data)} company records")
+                return data
+            
             response.raise_for_status()
             
-            data = response.json()
+            # Keep the gzip body exactly as served and decompress it once in memory
+            payload = response.raw.read(decode_content=False)
+            if response.headers.get('Content-Encoding', '').lower() == 'gzip':
+                compressed, body = payload, gzip.decompress(payload)
+            else:
+                compressed, body = gzip.compress(payload), payload
+            self.raw_file.write_bytes(compressed)
             
-            # Save raw data
-            raw_file = self.data_dir / "company_tickers.json"
-            with open(raw_file, 'w', encoding='utf-8') as f:
-                json.dump(data, f, indent=2, ensure_ascii=False)
+            data = orjson.loads(body)
+            self.save_http_cache(response)
             
-            logger.info(f"Raw data saved to {raw_file}")
+            logger.info(f"Raw data saved to {self.raw_file}")
             logger.info(f"Downloaded {len(data)} company records")
             
             return data
@@ -89,7 +155,7 @@ class CIKDownloader:
         except requests.exceptions.RequestException as e:
             logger.error(f"Error downloading data from SEC: {e}")
             raise
-        except json.JSONDecodeError as e:
+        except orjson.JSONDecodeError as e:
             logger.error(f"Error parsing JSON response: {e}")
             raise
     
@@ -109,11 +175,12 @@ class CIKDownloader:
         
         for key, company_info in raw_data.items():
             if isinstance(company_info, dict):
+                cik_raw = int(company_info.get('cik_str', 0))
                 processed_record = {
                     'ticker': company_info.get('ticker', '').upper(),
                     'company_name': company_info.get('title', ''),
-                    'cik': str(company_info.get('cik_str', '')).zfill(10),  # Pad with zeros to 10 digits
-                    'cik_raw': company_info.get('cik_str', ''),
+                    'cik': str(cik_raw).zfill(10),  # Pad with zeros to 10 digits
+                    'cik_raw': cik_raw,
                     'last_updated': datetime.now().isoformat()
                 }
                 processed_data.append(processed_record)
@@ -131,17 +198,18 @@ class CIKDownloader:
         Args:
             processed_data (list): Processed company data
         """
-        # Save as JSON
+        # Save as JSON (compact unless pretty output was requested; CIKLookup is the main reader)
         json_file = self.data_dir / "cik_database.json"
-        with open(json_file, 'w', encoding='utf-8') as f:
-            json.dump({
+        self.last_updated = datetime.now().isoformat()
+        with open(json_file, 'wb') as f:
+            f.write(orjson.dumps({
                 'metadata': {
                     'total_companies': len(processed_data),
-                    'last_updated': datetime.now().isoformat(),
+                    'last_updated': self.last_updated,
                     'source': 'SEC EDGAR company_tickers.json'
                 },
                 'companies': processed_data
-            }, f, indent=2, ensure_ascii=False)
+            }, option=orjson.OPT_INDENT_2 if self.pretty else None))
         
         logger.info(f"JSON data saved to {json_file}")
         
@@ -149,10 +217,11 @@ class CIKDownloader:
         csv_file = self.data_dir / "cik_database.csv"
         with open(csv_file, 'w', newline='', encoding='utf-8') as f:
             if processed_data:
-                fieldnames = processed_data[0].keys()
-                writer = csv.DictWriter(f, fieldnames=fieldnames)
-                writer.writeheader()
-                writer.writerows(processed_data)
+                # Plain tuples skip DictWriter's per-row dict-to-list conversion
+                fieldnames = tuple(processed_data[0])
+                writer = csv.writer(f)
+                writer.writerow(fieldnames)
+                writer.writerows(tuple(record[field] for field in fieldnames) for record in processed_data)
         
         logger.info(f"CSV data saved to {csv_file}")
     
@@ -163,17 +232,22 @@ class CIKDownloader:
         Args:
             processed_data (list): Processed company data
         """
+        companies_with_tickers = sum(1 for c in processed_data if c['ticker'])
+        
         summary = {
             'total_companies': len(processed_data),
-            'companies_with_tickers': len([c for c in processed_data if c['ticker']]),
-            'companies_without_tickers': len([c for c in processed_data if not c['ticker']]),
+            'companies_with_tickers': companies_with_tickers,
+            'companies_without_tickers': len(processed_data) - companies_with_tickers,
             'download_timestamp': datetime.now().isoformat(),
+            # Same fields as CIKLookup.get_statistics(), so cik_lookup.py --stats can skip loading the database
+            'last_updated': self.last_updated,
+            'sample_tickers': list(islice((c['ticker'] for c in processed_data if c['ticker']), 10)),
             'sample_companies': processed_data[:5] if processed_data else []
         }
         
         summary_file = self.data_dir / "download_summary.json"
-        with open(summary_file, 'w', encoding='utf-8') as f:
-            json.dump(summary, f, indent=2, ensure_ascii=False)
+        with open(summary_file, 'wb') as f:
+            f.write(orjson.dumps(summary, option=orjson.OPT_INDENT_2))
         
         logger.info(f"Summary report saved to {summary_file}")
         logger.info(f"Total companies: {summary['total_companies']}")
@@ -209,7 +283,12 @@ def main():
     """
     Main function to run the CIK downloader.
     """
-    downloader = CIKDownloader()
+    parser = argparse.ArgumentParser(description="Download company CIK data from SEC EDGAR")
+    parser.add_argument('--pretty', action='store_true',
+                        help='Write cik_database.json indented for human inspection')
+    args = parser.parse_args()
+    
+    downloader = CIKDownloader(pretty=args.pretty)
     downloader.run()
 
 if __name__ == "__main__":
@@ -1,373 +1,490 @@
 #!/usr/bin/env python3
 """
-SEC Filing Downloader using sec-edgar-downloader library
+SEC Filing Downloader using the SEC submissions API
 Downloads SEC filings for specified tickers and organizes them in data/raw directory.
 """
 
 import os
-import json
-import time
 import sys
+import atexit
+import logging
+import operator
+import queue
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from logging.handlers import QueueHandler, QueueListener
 from pathlib import Path
 from datetime import datetime, timedelta
-from sec_edgar_downloader import Downloader
+import orjson
 from dotenv import load_dotenv
+from download_sec_submissions import SECSubmissionsDownloader, write_atomic
 
 # Load environment variables
 load_dotenv()
 
+# Log through a queue so worker threads never block on stdout; one listener thread does the writing
+_log_queue = queue.Queue(-1)
+_log_handler = logging.StreamHandler(sys.stdout)
+_log_handler.setFormatter(logging.Formatter('%(message)s'))
+_log_listener = QueueListener(_log_queue, _log_handler)
+_log_listener.start()
+atexit.register(_log_listener.stop)
+
+logger = logging.getLogger('download_data')
+logger.addHandler(QueueHandler(_log_queue))
+logger.setLevel(logging.INFO)
+logger.propagate = False
+
+# Per-ticker file holding every processed filing, one JSON object per line
+FILINGS_FILE = 'filings.ndjson'
+
+# Leading bytes of each filing kept as its content (full submissions can be many MB)
+FILING_CONTENT_LIMIT = 10000
+
+# Most recent filings kept per form type
+FILINGS_PER_FORM = 10
+
+# Form types to keep from each company's submissions - comprehensive list
+FILING_TYPES = frozenset({
+    '10-K',      # Annual Report
+    '10-Q',      # Quarterly Report
+    '8-K',       # Current Report
+    'DEF 14A',   # Proxy Statement
+    '10-K/A',    # Annual Report Amendment
+    '10-Q/A',    # Quarterly Report Amendment
+    '8-K/A',     # Current Report Amendment
+    'S-1',       # Registration Statement
+    'S-3',       # Registration Statement
+    'S-4',       # Registration Statement
+    'S-8',       # Registration Statement for Employee Stock Plans
+    'F-1',       # Registration Statement (Foreign)
+    'F-3',       # Registration Statement (Foreign)
+    'F-4',       # Registration Statement (Foreign)
+    '20-F',      # Annual Report (Foreign)
+    '40-F',      # Annual Report (Foreign)
+    '6-K',       # Report of Foreign Private Issuer
+    'SC 13D',    # Beneficial Ownership Report
+    'SC 13G',    # Beneficial Ownership Report
+    'SC 13D/A',  # Beneficial Ownership Report Amendment
+    'SC 13G/A',  # Beneficial Ownership Report Amendment
+    '3',         # Initial Statement of Beneficial Ownership
+    '4',         # Statement of Changes in Beneficial Ownership
+    '5',         # Annual Statement of Changes in Beneficial Ownership
+    '11-K',      # Annual Report of Employee Stock Purchase Plans
+    'NT 10-K',   # Notification of Late Filing
+    'NT 10-Q',   # Notification of Late Filing
+    'NT 20-F',   # Notification of Late Filing
+    'DEFA14A',   # Additional Proxy Soliciting Materials
+    'PRER14A',   # Preliminary Proxy Statement
+    'DEFR14A',   # Definitive Proxy Statement
+    'PREC14A',   # Preliminary Proxy Statement
+    'DEFC14A',   # Definitive Proxy Statement
+    'PRE 14A',   # Preliminary Proxy Statement
+    'DEFM14A',   # Definitive Proxy Statement
+    'PREM14A',   # Preliminary Proxy Statement
+    'DEFN14A',   # Definitive Proxy Statement
+    'PREN14A',   # Preliminary Proxy Statement
+    'DEFR14C',   # Definitive Information Statement
+    'PRER14C',   # Preliminary Information Statement
+    'DEF 14C',   # Definitive Information Statement
+    'PRE 14C',   # Preliminary Information Statement
+    'DFRN14A',   # Definitive Additional Materials
+    'DFAN14A',   # Definitive Additional Materials
+    'PRRN14A',   # Preliminary Additional Materials
+    'PRFN14A',   # Preliminary Additional Materials
+    'PRAN14A',   # Preliminary Additional Materials
+    'UPLOAD',    # Correspondence
+    'CORRESP',   # Correspondence
+    'COVER',     # Cover Page
+    'EX-99',     # Additional Exhibits
+    'EX-101',    # XBRL Instance Document
+    'EX-32',     # Section 302 Certification
+    'EX-31',     # Section 302 Certification
+    'EFFECT',    # Notice of Effectiveness
+    'POS AM',    # Post-Effective Amendment
+    'POS 462B',  # Post-Effective Amendment
+    'POS 462C',  # Post-Effective Amendment
+    'POSAM',     # Post-Effective Amendment
+    'RW',        # Registration Withdrawal
+    'RW WD',     # Registration Withdrawal
+    'SUPPL',     # Supplement to Prospectus
+    '424B1',     # Prospectus
+    '424B2',     # Prospectus
+    '424B3',     # Prospectus
+    '424B4',     # Prospectus
+    '424B5',     # Prospectus
+    '424B7',     # Prospectus
+    '424B8',     # Prospectus
+    '497',       # Definitive Materials
+    '497AD',     # Definitive Materials
+    '497J',      # Certification of No Change
+    '497K',      # Summary Prospectus
+    'N-1A',      # Registration Statement (Investment Company)
+    'N-2',       # Registration Statement (Closed-End Investment Company)
+    'N-3',       # Registration Statement (Separate Account)
+    'N-4',       # Registration Statement (Variable Annuity)
+    'N-5',       # Registration Statement (Small Business Investment Company)
+    'N-6',       # Registration Statement (Unit Investment Trust)
+    'N-8A',      # Notification of Registration
+    'N-8B-2',    # Registration Statement (Unit Investment Trust)
+    'N-14',      # Registration Statement (Investment Company)
+    'N-18F1',    # Notification of Election
+    'N-23C3A',   # Notification of Periodic Repurchase Offer
+    'N-23C3B',   # Notification of Periodic Repurchase Offer
+    'N-23C3C',   # Notification of Periodic Repurchase Offer
+    'N-27D-1',   # Accounting for Deferred Charges
+    'N-30B-2',   # Periodic Report
+    'N-30D',     # Annual Report
+    'N-CSR',     # Certified Shareholder Report
+    'N-CSRS',    # Semi-Annual Report
+    'N-Q',       # Quarterly Schedule of Portfolio Holdings
+    'N-PX',      # Annual Report of Proxy Voting Record
+    'N-CEN',     # Annual Report for Registered Investment Companies
+    'ADV',       # Investment Adviser Registration
+    'ADV-E',     # Investment Adviser Registration
+    'ADV-H',     # Investment Adviser Registration
+    'ADV-NR',    # Investment Adviser Registration
+    'ADV-W',     # Investment Adviser Registration
+    'PF',        # Private Fund Report
+    'ABS-EE',    # Asset-Backed Securities
+    'ABS-15G',   # Asset-Backed Securities
+    'CFPORTAL',  # Funding Portal Report
+    'CRS',       # Customer Relationship Summary
+    'CUSTODY',   # Custody Report
+    'MSD',       # Municipal Securities Dealer Report
+    'MSDW',      # Municipal Securities Dealer Withdrawal
+    'X-17A-5',   # Financial and Operational Combined Uniform Single Report
+    'ATS',       # Alternative Trading System
+    'ATS-N',     # Alternative Trading System
+    'ATS-R',     # Alternative Trading System
+    'BD',        # Broker-Dealer Registration
+    'BD-N',      # Broker-Dealer Registration
+    'BDW',       # Broker-Dealer Withdrawal
+    'SBS',       # Security-Based Swap
+    'SBSE',      # Security-Based Swap Execution Facility
+    'SBSE-A',    # Security-Based Swap Execution Facility
+    'SBSE-BD',   # Security-Based Swap Execution Facility
+    'SBSE-C',    # Security-Based Swap Execution Facility
+    'SDR',       # Security-Based Swap Data Repository
+    'TA-1',      # Transfer Agent Registration
+    'TA-2',      # Transfer Agent Registration
+    'TA-W',      # Transfer Agent Withdrawal
+    'ID',        # Information Document
+    'MA',        # Municipal Advisor Registration
+    'MA-I',      # Municipal Advisor Registration
+    'MA-NR',     # Municipal Advisor Registration
+    'MA-W',      # Municipal Advisor Withdrawal
+    'NRSRO',     # Nationally Recognized Statistical Rating Organization
+    'PILOT',     # Pilot Program Report
+    'REP',       # Regulatory Report
+    'SCI',       # Systems Compliance and Integrity
+    'TCR',       # Tip, Complaint or Referral
+    'TH',        # Temporary Hardship Exemption
+    'WB-APP',    # Whistleblower Application
+    'WB-DEC',    # Whistleblower Declaration
+})
+
 class SECDownloader:
     def __init__(self):
         # Get configuration from environment variables
         self.company_name = os.getenv('COMPANY_NAME', 'Your Company Name')
         self.email = os.getenv('EMAIL', 'your.email@example.com')
         
+        # Number of tickers downloaded concurrently
+        self.max_workers = int(os.getenv('MAX_WORKERS', '4'))
+        
+        # Number of filing documents fetched concurrently within each ticker
+        self.document_workers = int(os.getenv('DOCUMENT_WORKERS', '4'))
+        
+        # Shared limit on EDGAR queries across all workers (SEC allows 10 requests/second)
+        self.rate_limit = float(os.getenv('SEC_RATE_LIMIT', '10'))
+        
+        # Serialized files are handed to a single writer thread so workers keep downloading
+        self.write_queue = queue.Queue(maxsize=32)
+        self.writer_thread = None
+        
         # Set up directories (adjust path since script is now in scripts/python/)
         self.base_dir = Path(__file__).parent.parent.parent
         self.raw_data_dir = self.base_dir / 'data' / 'raw'
         self.raw_data_dir.mkdir(parents=True, exist_ok=True)
         
-        # Initialize downloader
-        self.downloader = Downloader(self.company_name, self.email)
+        # Pooled SEC session shared by the submissions lookups and the filing document fetches
+        self.submissions = SECSubmissionsDownloader(max_workers=self.max_workers * self.document_workers,
+                                                    rate_limit=self.rate_limit)
+        self.submissions.session.headers['User-Agent'] = f"{self.company_name} {self.email}"
+        
+        # Its token bucket paces every request made here, including the filing document fetches
+        self.rate_limiter = self.submissions.rate_limiter
+        
+        # Ticker -> CIK map from the local CIK database (see cik_management/download_cik_data.py)
+        self.ticker_ciks = self.load_ticker_ciks()
         
         # Date range for filings (last 6 months)
         self.end_date = datetime.now().date()
         self.start_date = self.end_date - timedelta(days=180)
         
-        print(f"📊 SEC Filing Downloader initialized")
-        print(f"📅 Date range: {self.start_date} to {self.end_date}")
-        print(f"📁 Raw data directory: {self.raw_data_dir}")
+        # ISO strings compared against every filing date, formatted once
+        self.start_iso = self.start_date.isoformat()
+        self.end_iso = self.end_date.isoformat()
+        
+        logger.info(f"📊 SEC Filing Downloader initialized")
+        logger.info(f"📅 Date range: {self.start_date} to {self.end_date}")
+        logger.info(f"📁 Raw data directory: {self.raw_data_dir}")
+        logger.info(f"🧵 Concurrent tickers: {self.max_workers} ({self.document_workers} documents each)")
+        logger.info(f"⏱️  Rate limit: {self.rate_limit:g} requests/second")
+    
+    def start_writer(self):
+        """Start the background thread that writes serialized files to disk"""
+        self.writer_thread = threading.Thread(target=self._writer_loop, daemon=True)
+        self.writer_thread.start()
+    
+    def stop_writer(self):
+        """Flush pending writes and stop the writer thread"""
+        if self.writer_thread:
+            self.write_queue.put(None)
+            self.writer_thread.join()
+            self.writer_thread = None
+    
+    def _writer_loop(self):
+        """Drain (path, bytes) items from the write queue until the None sentinel"""
+        while True:
+            item = self.write_queue.get()
+            if item is None:
+                break
+            path, data = item
+            try:
+                # Atomic, so content in an existing filings.ndjson can be reused by later runs
+                write_atomic(path, data)
+            except Exception as e:
+                # Keep draining: workers block on the bounded queue if this thread dies
+                logger.error(f"❌ Error writing {path}: {e}")
+    
+    def write_file(self, path, data):
+        """Queue bytes for the writer thread, or write directly when it is not running"""
+        if self.writer_thread:
+            self.write_queue.put((path, data))
+        else:
+            write_atomic(path, data)
     
     def load_tickers(self):
         """Load ticker symbols from tickers.json"""
         tickers_file = self.base_dir / 'tickers.json'
         try:
-            with open(tickers_file, 'r') as f:
-                tickers = json.load(f)
-            print(f"✅ Loaded {len(tickers)} tickers: {', '.join(tickers)}")
+            tickers = orjson.loads(tickers_file.read_bytes())
+            logger.info(f"✅ Loaded {len(tickers)} tickers: {', '.join(tickers)}")
             return tickers
         except FileNotFoundError:
-            print(f"❌ Error: {tickers_file} not found")
+            logger.error(f"❌ Error: {tickers_file} not found")
             return []
-        except json.JSONDecodeError as e:
-            print(f"❌ Error parsing {tickers_file}: {e}")
+        except orjson.JSONDecodeError as e:
+            logger.error(f"❌ Error parsing {tickers_file}: {e}")
             return []
     
+    def load_ticker_ciks(self):
+        """Map ticker symbols to zero-padded CIKs using the local CIK database"""
+        database_file = self.base_dir / 'data' / 'cik_database' / 'cik_database.json'
+        try:
+            companies = orjson.loads(database_file.read_bytes()).get('companies', [])
+        except FileNotFoundError:
+            logger.error(f"❌ Error: {database_file} not found (run cik_management/download_cik_data.py first)")
+            return {}
+        except orjson.JSONDecodeError as e:
+            logger.error(f"❌ Error parsing {database_file}: {e}")
+            return {}
+        
+        ticker_ciks = {}
+        for company in companies:
+            if company.get('ticker') and company.get('cik'):
+                ticker_ciks.setdefault(company['ticker'].upper(), company['cik'])
+        return ticker_ciks
+    
     def check_existing_data(self, ticker):
-        """Check if data already exists for a ticker"""
+        """Check if a legacy download (per-filing JSON files) exists for a ticker
+        
+        An existing filings.ndjson is not reported here: it is topped up with new filings instead of skipped.
+        """
         ticker_dir = self.raw_data_dir / ticker
-        if not ticker_dir.exists():
-            return False
         
-        # Check if there are any JSON files (excluding timeline_summary.json)
-        json_files = [f for f in ticker_dir.glob('*.json') if f.name != 'timeline_summary.json']
+        # Look for legacy per-filing JSON files (excluding timeline_summary.json),
+        # stopping at the first one found
+        try:
+            with os.scandir(ticker_dir) as entries:
+                has_legacy_filings = any(entry.name.endswith('.json') and entry.name != 'timeline_summary.json'
+                                         for entry in entries)
+        except FileNotFoundError:
+            return False
         
-        if json_files:
-            print(f"📁 Data already exists for {ticker} ({len(json_files)} filings found)")
+        if has_legacy_filings:
+            logger.info(f"📁 Data already exists for {ticker} (legacy per-filing JSON files found)")
             return True
         return False
     
     def download_filings_for_ticker(self, ticker, force_download=False):
         """Download filings for a specific ticker"""
-        print(f"\nProcessing ticker: {ticker}")
+        logger.info(f"\nProcessing ticker: {ticker}")
         
-        # Check if data already exists
+        # Legacy per-filing downloads cannot be merged into, so those tickers are still skipped
         if not force_download and self.check_existing_data(ticker):
-            print(f"⏭️  Skipping {ticker} - data already downloaded")
+            logger.info(f"⏭️  Skipping {ticker} - data already downloaded")
+            return 0
+        
+        cik = self.ticker_ciks.get(ticker.upper())
+        if not cik:
+            logger.warning(f"⚠️  No CIK found for {ticker} in the CIK database")
             return 0
         
         ticker_dir = self.raw_data_dir / ticker
         ticker_dir.mkdir(exist_ok=True)
         
-        # Download different types of filings - comprehensive list
-        filing_types = [
-            '10-K',      # Annual Report
-            '10-Q',      # Quarterly Report
-            '8-K',       # Current Report
-            'DEF 14A',   # Proxy Statement
-            '10-K/A',    # Annual Report Amendment
-            '10-Q/A',    # Quarterly Report Amendment
-            '8-K/A',     # Current Report Amendment
-            'S-1',       # Registration Statement
-            'S-3',       # Registration Statement
-            'S-4',       # Registration Statement
-            'S-8',       # Registration Statement for Employee Stock Plans
-            'F-1',       # Registration Statement (Foreign)
-            'F-3',       # Registration Statement (Foreign)
-            'F-4',       # Registration Statement (Foreign)
-            '20-F',      # Annual Report (Foreign)
-            '40-F',      # Annual Report (Foreign)
-            '6-K',       # Report of Foreign Private Issuer
-            'SC 13D',    # Beneficial Ownership Report
-            'SC 13G',    # Beneficial Ownership Report
-            'SC 13D/A',  # Beneficial Ownership Report Amendment
-            'SC 13G/A',  # Beneficial Ownership Report Amendment
-            '3',         # Initial Statement of Beneficial Ownership
-            '4',         # Statement of Changes in Beneficial Ownership
-            '5',         # Annual Statement of Changes in Beneficial Ownership
-            '11-K',      # Annual Report of Employee Stock Purchase Plans
-            'NT 10-K',   # Notification of Late Filing
-            'NT 10-Q',   # Notification of Late Filing
-            'NT 20-F',   # Notification of Late Filing
-            'DEFA14A',   # Additional Proxy Soliciting Materials
-            'PRER14A',   # Preliminary Proxy Statement
-            'DEFR14A',   # Definitive Proxy Statement
-            'PREC14A',   # Preliminary Proxy Statement
-            'DEFC14A',   # Definitive Proxy Statement
-            'PRE 14A',   # Preliminary Proxy Statement
-            'DEFM14A',   # Definitive Proxy Statement
-            'PREM14A',   # Preliminary Proxy Statement
-            'DEFN14A',   # Definitive Proxy Statement
-            'PREN14A',   # Preliminary Proxy Statement
-            'DEFR14C',   # Definitive Information Statement
-            'PRER14C',   # Preliminary Information Statement
-            'DEF 14C',   # Definitive Information Statement
-            'PRE 14C',   # Preliminary Information Statement
-            'DFRN14A',   # Definitive Additional Materials
-            'DFAN14A',   # Definitive Additional Materials
-            'PRRN14A',   # Preliminary Additional Materials
-            'PRFN14A',   # Preliminary Additional Materials
-            'PRAN14A',   # Preliminary Additional Materials
-            'PRFN14A',   # Preliminary Additional Materials
-            'UPLOAD',    # Correspondence
-            'CORRESP',   # Correspondence
-            'COVER',     # Cover Page
-            'EX-99',     # Additional Exhibits
-            'EX-101',    # XBRL Instance Document
-            'EX-32',     # Section 302 Certification
-            'EX-31',     # Section 302 Certification
-            'EFFECT',    # Notice of Effectiveness
-            'POS AM',    # Post-Effective Amendment
-            'POS 462B',  # Post-Effective Amendment
-            'POS 462C',  # Post-Effective Amendment
-            'POSAM',     # Post-Effective Amendment
-            'RW',        # Registration Withdrawal
-            'RW WD',     # Registration Withdrawal
-            'SUPPL',     # Supplement to Prospectus
-            '424B1',     # Prospectus
-            '424B2',     # Prospectus
-            '424B3',     # Prospectus
-            '424B4',     # Prospectus
-            '424B5',     # Prospectus
-            '424B7',     # Prospectus
-            '424B8',     # Prospectus
-            '497',       # Definitive Materials
-            '497AD',     # Definitive Materials
-            '497J',      # Certification of No Change
-            '497K',      # Summary Prospectus
-            'N-1A',      # Registration Statement (Investment Company)
-            'N-2',       # Registration Statement (Closed-End Investment Company)
-            'N-3',       # Registration Statement (Separate Account)
-            'N-4',       # Registration Statement (Variable Annuity)
-            'N-5',       # Registration Statement (Small Business Investment Company)
-            'N-6',       # Registration Statement (Unit Investment Trust)
-            'N-8A',      # Notification of Registration
-            'N-8B-2',    # Registration Statement (Unit Investment Trust)
-            'N-14',      # Registration Statement (Investment Company)
-            'N-18F1',    # Notification of Election
-            'N-23C3A',   # Notification of Periodic Repurchase Offer
-            'N-23C3B',   # Notification of Periodic Repurchase Offer
-            'N-23C3C',   # Notification of Periodic Repurchase Offer
-            'N-27D-1',   # Accounting for Deferred Charges
-            'N-30B-2',   # Periodic Report
-            'N-30D',     # Annual Report
-            'N-CSR',     # Certified Shareholder Report
-            'N-CSRS',    # Semi-Annual Report
-            'N-Q',       # Quarterly Schedule of Portfolio Holdings
-            'N-PX',      # Annual Report of Proxy Voting Record
-            'N-CEN',     # Annual Report for Registered Investment Companies
-            'ADV',       # Investment Adviser Registration
-            'ADV-E',     # Investment Adviser Registration
-            'ADV-H',     # Investment Adviser Registration
-            'ADV-NR',    # Investment Adviser Registration
-            'ADV-W',     # Investment Adviser Registration
-            'PF',        # Private Fund Report
-            'ABS-EE',    # Asset-Backed Securities
-            'ABS-15G',   # Asset-Backed Securities
-            'CFPORTAL',  # Funding Portal Report
-            'CRS',       # Customer Relationship Summary
-            'CUSTODY',   # Custody Report
-            'MSD',       # Municipal Securities Dealer Report
-            'MSDW',      # Municipal Securities Dealer Withdrawal
-            'X-17A-5',   # Financial and Operational Combined Uniform Single Report
-            'ATS',       # Alternative Trading System
-            'ATS-N',     # Alternative Trading System
-            'ATS-R',     # Alternative Trading System
-            'BD',        # Broker-Dealer Registration
-            'BD-N',      # Broker-Dealer Registration
-            'BDW',       # Broker-Dealer Withdrawal
-            'SBS',       # Security-Based Swap
-            'SBSE',      # Security-Based Swap Execution Facility
-            'SBSE-A',    # Security-Based Swap Execution Facility
-            'SBSE-BD',   # Security-Based Swap Execution Facility
-            'SBSE-C',    # Security-Based Swap Execution Facility
-            'SDR',       # Security-Based Swap Data Repository
-            'TA-1',      # Transfer Agent Registration
-            'TA-2',      # Transfer Agent Registration
-            'TA-W',      # Transfer Agent Withdrawal
-            'ID',        # Information Document
-            'MA',        # Municipal Advisor Registration
-            'MA-I',      # Municipal Advisor Registration
-            'MA-NR',     # Municipal Advisor Registration
-            'MA-W',      # Municipal Advisor Withdrawal
-            'NRSRO',     # Nationally Recognized Statistical Rating Organization
-            'PILOT',     # Pilot Program Report
-            'REP',       # Regulatory Report
-            'SCI',       # Systems Compliance and Integrity
-            'TCR',       # Tip, Complaint or Referral
-            'TH',        # Temporary Hardship Exemption
-            'WB-APP',    # Whistleblower Application
-            'WB-DEC',    # Whistleblower Declaration
-        ]
-        total_filings = 0
-        
-        for filing_type in filing_types:
-            try:
-                print(f"  📄 Downloading {filing_type} filings...")
-                
-                # Create a downloader instance for this specific download location
-                temp_dir = ticker_dir / 'temp'
-                temp_dir.mkdir(exist_ok=True)
-                
-                # Create downloader with specific download folder
-                downloader = Downloader(self.company_name, self.email, str(temp_dir))
-                
-                # Use sec-edgar-downloader to get filings
-                filings_count = downloader.get(
-                    filing_type,
-                    ticker,
-                    after=self.start_date.strftime('%Y-%m-%d'),
-                    before=self.end_date.strftime('%Y-%m-%d'),
-                    limit=10  # Limit to 10 most recent filings
-                )
-                
-                if filings_count > 0:
-                    # Process downloaded files
-                    self.process_downloaded_files(temp_dir, ticker_dir, filing_type)
-                    total_filings += filings_count
-                    print(f"    ✅ Downloaded {filings_count} {filing_type} filings")
-                else:
-                    print(f"    ℹ️  No {filing_type} filings found")
-                
-                # Clean up temp directory
-                import shutil
-                if temp_dir.exists():
-                    shutil.rmtree(temp_dir)
-                
-                # Add 1 second sleep between filing type extractions
-                time.sleep(1)
-                    
-            except Exception as e:
-                print(f"    ⚠️  Error downloading {filing_type}: {e}")
-                # Add sleep even on error to avoid overwhelming the server
-                time.sleep(1)
+        # One submissions request lists every recent filing for the company; filter it locally
+        try:
+            submissions, _ = self.submissions.download_submissions(cik, verbose=False)  # Acquires its own token
+            self.rate_limiter.record_success()
+        except Exception as e:
+            self.log_request_error(e, f"submissions for {ticker}")
+            return 0
+        
+        selected = self.select_filings(submissions)
+        company_name = submissions.get('name') or ticker
+        
+        # Filings are immutable once accepted, so content saved by an earlier run is reused by accession number
+        # and only new accessions are fetched; --force re-fetches everything
+        known_contents = {} if force_download else self.load_known_contents(ticker_dir)
+        new_count = sum(1 for _, accession_number, _ in selected if accession_number not in known_contents)
+        logger.info(f"  📄 {len(selected)} matching filings for {ticker} (CIK {cik}), {new_count} new")
         
-        if total_filings > 0:
+        if known_contents and known_contents.keys() == {accession_number for _, accession_number, _ in selected}:
+            logger.info(f"⏭️  Skipping {ticker} - {FILINGS_FILE} is up to date")
+            return 0
+        
+        # Filing documents download concurrently (the shared rate limiter still caps requests);
+        # map keeps filings in submissions order, newest first
+        with ThreadPoolExecutor(max_workers=self.document_workers, thread_name_prefix=f"{ticker}-filings") as executor:
+            results = executor.map(
+                lambda filing: self.fetch_filing(cik, company_name, filing, known_contents.get(filing[1])),
+                selected
+            )
+            processed_filings = [filing_data for filing_data in results if filing_data]
+        total_filings = len(processed_filings)
+        
+        if processed_filings:
+            # Write all filings for the ticker in a single file
+            filings_path = ticker_dir / FILINGS_FILE
+            self.write_file(filings_path, b''.join(orjson.dumps(filing) + b'\n' for filing in processed_filings))
+            logger.info(f"  💾 Saved {len(processed_filings)} filings to {FILINGS_FILE}")
+            
             # Create timeline summary
-            self.create_timeline_summary(ticker_dir, ticker)
-            print(f"✅ Completed {ticker} ({total_filings} filings processed)")
+            self.create_timeline_summary(ticker_dir, ticker, processed_filings)
+            logger.info(f"✅ Completed {ticker} ({total_filings} filings processed)")
         else:
-            print(f"⚠️  No filings found for {ticker}")
+            logger.warning(f"⚠️  No filings found for {ticker}")
         
         return total_filings
     
-    def process_downloaded_files(self, temp_dir, ticker_dir, filing_type):
-        """Process files downloaded by sec-edgar-downloader"""
-        # sec-edgar-downloader creates a structure like: temp_dir/sec-edgar-filings/TICKER/FILING_TYPE/
-        edgar_dir = temp_dir / 'sec-edgar-filings'
-        if not edgar_dir.exists():
-            return
+    def select_filings(self, submissions):
+        """Pick (form, accession_number, filing_date) entries in the date range, newest first per form"""
+        recent = submissions.get('filings', {}).get('recent', {})
+        per_form = {}
+        selected = []
         
-        # Find the ticker directory
-        for ticker_folder in edgar_dir.iterdir():
-            if ticker_folder.is_dir():
-                filing_type_dir = ticker_folder / filing_type
-                if filing_type_dir.exists():
-                    # Process each filing
-                    for filing_dir in filing_type_dir.iterdir():
-                        if filing_dir.is_dir():
-                            self.convert_filing_to_json(filing_dir, ticker_dir, filing_type)
+        for form, accession_number, filing_date in zip(recent.get('form', []),
+                                                       recent.get('accessionNumber', []),
+                                                       recent.get('filingDate', [])):
+            if form not in FILING_TYPES or not (self.start_iso <= filing_date <= self.end_iso):
+                continue
+            
+            # Recent filings are listed newest first, so the first hits per form are the latest
+            count = per_form.get(form, 0)
+            if count < FILINGS_PER_FORM:
+                per_form[form] = count + 1
+                selected.append((form, accession_number, filing_date))
+        
+        return selected
     
-    def convert_filing_to_json(self, filing_dir, ticker_dir, filing_type):
-        """Convert downloaded filing to our JSON format"""
+    def load_known_contents(self, ticker_dir):
+        """Map accession numbers in an existing filings.ndjson to their saved content"""
+        filings_path = ticker_dir / FILINGS_FILE
+        if not filings_path.exists():
+            return {}
+        
+        known_contents = {}
         try:
-            # Get filing metadata from directory name
-            # Format is usually: ACCESSION-NUMBER
-            accession_number = filing_dir.name
-            
-            # Look for the main filing file (usually .txt or .htm)
-            filing_files = list(filing_dir.glob('*.txt')) + list(filing_dir.glob('*.htm'))
-            if not filing_files:
-                return
-            
-            main_file = filing_files[0]
-            
-            # Extract date from accession number or use current date
-            try:
-                # Accession format: XXXXXXXXXX-XX-XXXXXX
-                date_part = accession_number.split('-')[1]
-                filing_date = f"20{date_part[:2]}-{date_part[2:4]}-{date_part[4:6]}"
-            except:
-                filing_date = datetime.now().strftime('%Y-%m-%d')
-            
-            # Read filing content
+            with open(filings_path, 'rb') as f:
+                for line in f:
+                    if not line.strip():
+                        continue
+                    filing_data = orjson.loads(line)
+                    if filing_data.get('accession_number') and filing_data.get('content'):
+                        known_contents[filing_data['accession_number']] = filing_data['content']
+        except (OSError, orjson.JSONDecodeError) as e:
+            logger.warning(f"  ⚠️  Ignoring unreadable {filings_path}: {e}")
+            return {}
+        return known_contents
+    
+    def fetch_filing(self, cik, company_name, filing, known_content=None):
+        """Download the head of one filing's full submission text (unless already known) and return our JSON structure"""
+        form, accession_number, filing_date = filing
+        filing_url = (f"https://www.sec.gov/Archives/edgar/data/{int(cik)}/"
+                      f"{accession_number.replace('-', '')}/{accession_number}.txt")
+        
+        if known_content is not None:
+            content = known_content
+        else:
             try:
-                with open(main_file, 'r', encoding='utf-8', errors='ignore') as f:
-                    content = f.read()
-            except:
-                content = "Content could not be read"
-            
-            # Create our JSON structure
-            filing_data = {
-                "form": filing_type,
-                "filing_date": filing_date,
-                "accession_number": accession_number,
-                "company_name": "Company Name",  # Will be updated if available
-                "filing_url": f"https://www.sec.gov/Archives/edgar/data/{accession_number}",
-                "content": content[:10000] if len(content) > 10000 else content  # Limit content size
-            }
-            
-            # Save as JSON file
-            json_filename = f"{filing_type}_{filing_date}_{accession_number}.json"
-            json_path = ticker_dir / json_filename
-            
-            with open(json_path, 'w', encoding='utf-8') as f:
-                json.dump(filing_data, f, indent=2, ensure_ascii=False)
-            
-            print(f"    ✅ Saved {filing_type} filing from {filing_date}")
+                self.rate_limiter.acquire()
+                content = self.read_filing_head(filing_url)
+                self.rate_limiter.record_success()
+            except Exception as e:
+                self.log_request_error(e, f"{form} filing {accession_number}")
+                return None
             
-        except Exception as e:
-            print(f"    ⚠️  Error processing filing {filing_dir.name}: {e}")
+            logger.info(f"    ✅ Processed {form} filing from {filing_date}")
+        return {
+            "form": form,
+            "filing_date": filing_date,
+            "accession_number": accession_number,
+            "company_name": company_name,
+            "filing_url": filing_url,
+            "content": content  # Limited to the first FILING_CONTENT_LIMIT bytes
+        }
+    
+    def read_filing_head(self, url):
+        """Stream only the first FILING_CONTENT_LIMIT bytes of a filing instead of the whole document"""
+        head = bytearray()
+        # The shared session asks for JSON (it was built for the submissions API); filing documents are text/HTML
+        with self.submissions.session.get(url, stream=True, timeout=30, headers={'Accept': '*/*'}) as response:
+            response.raise_for_status()
+            for chunk in response.iter_content(chunk_size=FILING_CONTENT_LIMIT):
+                head += chunk
+                if len(head) >= FILING_CONTENT_LIMIT:
+                    break
+        return head[:FILING_CONTENT_LIMIT].decode('utf-8', errors='ignore')
     
-    def create_timeline_summary(self, ticker_dir, ticker):
-        """Create timeline_summary.json file"""
+    def log_request_error(self, error, what):
+        """Log a failed SEC request, backing the shared rate limiter off when SEC throttled it"""
+        if getattr(getattr(error, 'response', None), 'status_code', None) == 429:
+            new_rate = self.rate_limiter.record_throttle()
+            logger.info(f"    🐢 SEC throttled {what} request, slowing to {new_rate:g} requests/second")
+        else:
+            logger.warning(f"    ⚠️  Error downloading {what}: {error}")
+    
+    def create_timeline_summary(self, ticker_dir, ticker, processed_filings):
+        """Create timeline_summary.json file from the processed filings"""
         try:
-            # Get all JSON files in the ticker directory
-            json_files = list(ticker_dir.glob('*.json'))
-            
             filings = []
-            for json_file in json_files:
-                if json_file.name == 'timeline_summary.json':
-                    continue
-                
-                try:
-                    with open(json_file, 'r', encoding='utf-8') as f:
-                        filing_data = json.load(f)
-                    
-                    filings.append({
-                        "form": filing_data.get("form", "Unknown"),
-                        "filing_date": filing_data.get("filing_date", "Unknown"),
-                        "accession_number": filing_data.get("accession_number", "Unknown"),
-                        "company_name": filing_data.get("company_name", ticker),
-                        "filing_url": filing_data.get("filing_url", ""),
-                        "summary": f"SEC {filing_data.get('form', 'Filing')} filed on {filing_data.get('filing_date', 'Unknown date')}",
-                        "ai_timeline": f"{filing_data.get('filing_date', 'Unknown')}: {filing_data.get('form', 'Filing')} submitted"
-                    })
-                except Exception as e:
-                    print(f"    ⚠️  Error reading {json_file.name}: {e}")
+            for filing_data in processed_filings:
+                filings.append({
+                    "form": filing_data.get("form", "Unknown"),
+                    "filing_date": filing_data.get("filing_date", "Unknown"),
+                    "accession_number": filing_data.get("accession_number", "Unknown"),
+                    "company_name": filing_data.get("company_name", ticker),
+                    "filing_url": filing_data.get("filing_url", ""),
+                    "summary": f"SEC {filing_data.get('form', 'Filing')} filed on {filing_data.get('filing_date', 'Unknown date')}",
+                    "ai_timeline": f"{filing_data.get('filing_date', 'Unknown')}: {filing_data.get('form', 'Filing')} submitted"
+                })
             
             # Sort by filing date
-            filings.sort(key=lambda x: x.get('filing_date', ''), reverse=True)
+            filings.sort(key=operator.itemgetter('filing_date'), reverse=True)
             
             # Create timeline summary
             timeline_summary = {
@@ -379,46 +496,58 @@ class SECDownloader:
             
             # Save timeline summary
             timeline_path = ticker_dir / 'timeline_summary.json'
-            with open(timeline_path, 'w', encoding='utf-8') as f:
-                json.dump(timeline_summary, f, indent=2, ensure_ascii=False)
+            self.write_file(timeline_path, orjson.dumps(timeline_summary, option=orjson.OPT_INDENT_2))
             
-            print(f"  ✅ Generated timeline summary for {ticker}")
+            logger.info(f"  ✅ Generated timeline summary for {ticker}")
             
         except Exception as e:
-            print(f"  ⚠️  Error creating timeline summary: {e}")
+            logger.warning(f"  ⚠️  Error creating timeline summary: {e}")
     
     def run(self):
         """Main execution method"""
-        print("🚀 Starting SEC filing download...\n")
+        logger.info("🚀 Starting SEC filing download...\n")
         
         # Load tickers
         tickers = self.load_tickers()
         if not tickers:
-            print("❌ No tickers to process")
+            logger.error("❌ No tickers to process")
             return
         
         # Check for force download flag
         force_download = '--force' in sys.argv or '-f' in sys.argv
         if force_download:
-            print("⚠️  Force download mode enabled - will re-download existing data\n")
+            logger.warning("⚠️  Force download mode enabled - will re-download existing data\n")
         
-        # Process each ticker
+        # Process tickers concurrently - each ticker is dominated by SEC network waits
         successful_tickers = 0
-        for ticker in tickers:
-            try:
-                filings_count = self.download_filings_for_ticker(ticker, force_download)
-                if filings_count > 0:
-                    successful_tickers += 1
-            except Exception as e:
-                print(f"❌ Error processing {ticker}: {e}")
-        
-        print("\n" + "="*50)
-        print(f"Download completed! {successful_tickers}/{len(tickers)} tickers processed successfully")
-        print(f"Raw data saved in '{self.raw_data_dir}' directory")
-        print("\nTo use with SECChronicle app:")
-        print("1. Start the backend: python backend/main.py")
-        print("2. Start the frontend: cd frontend && npm run dev")
-        print("3. Open http://localhost:5173")
+        self.start_writer()
+        try:
+            with ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="ticker") as executor:
+                future_to_ticker = {
+                    executor.submit(self.download_filings_for_ticker, ticker, force_download): ticker
+                    for ticker in tickers
+                }
+                
+                for future in as_completed(future_to_ticker):
+                    ticker = future_to_ticker[future]
+                    try:
+                        filings_count = future.result()
+                        if filings_count > 0:
+                            successful_tickers += 1
+                    except Exception as e:
+                        logger.error(f"❌ Error processing {ticker}: {e}")
+        finally:
+            # The writer is a daemon thread, so queued files are flushed even when the run is interrupted
+            self.stop_writer()
+            self.submissions.close()
+        
+        logger.info("\n" + "="*50)
+        logger.info(f"Download completed! {successful_tickers}/{len(tickers)} tickers processed successfully")
+        logger.info(f"Raw data saved in '{self.raw_data_dir}' directory")
+        logger.info("\nTo use with SECChronicle app:")
+        logger.info("1. Start the backend: python backend/main.py")
+        logger.info("2. Start the frontend: cd frontend && npm run dev")
+        logger.info("3. Open http://localhost:5173")
 
 if __name__ == "__main__":
     downloader = SECDownloader()
@@ -17,17 +17,42 @@ Usage:
 """
 
 import argparse
-import json
+import orjson
 import os
+import random
 import requests
+from requests.adapters import HTTPAdapter
 import time
 import threading
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict, Any, List, Set
+from typing import Dict, Any, List, Optional, Tuple
 from dataclasses import dataclass
 from queue import Queue
-from datetime import datetime
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+
+
+# Submissions fields copied into each CIK's summary.json, with the default used when SEC omits one
+SUMMARY_FIELDS = (
+    ("name", None),
+    ("entityType", None),
+    ("sic", None),
+    ("sicDescription", None),
+    ("stateOfIncorporation", None),
+    ("stateOfIncorporationDescription", None),
+    ("fiscalYearEnd", None),
+    ("tickers", []),
+    ("exchanges", []),
+    ("ein", None),
+    ("description", None),
+    ("website", None),
+    ("investorWebsite", None),
+    ("category", None),
+    ("phone", None),
+    ("flags", None),
+    ("formerNames", []),
+)
 
 
 @dataclass
@@ -41,16 +66,100 @@ class DownloadResult:
     attempt_count: int = 1
 
 
+class TokenBucket:
+    """Thread-safe token bucket shared by all download workers."""
+    
+    def __init__(self, rate, burst=None):
+        self.rate = rate  # Tokens added per second
+        self.capacity = burst or max(1, int(rate))
+        self.tokens = float(self.capacity)
+        self.last_refill = time.monotonic()
+        self.lock = threading.Lock()
+    
+    def acquire(self):
+        """Block until a token is available, then consume it."""
+        while True:
+            with self.lock:
+                now = time.monotonic()
+                self.tokens = min(self.capacity, self.tokens + (now - self.last_refill) * self.rate)
+                self.last_refill = now
+                
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                
+                wait_time = (1 - self.tokens) / self.rate
+            
+            # Sleep outside the lock so other workers can refill and check
+            time.sleep(wait_time)
+
+
+class AdaptiveTokenBucket(TokenBucket):
+    """Token bucket whose rate backs off on throttling (AIMD: additive increase, multiplicative decrease)."""
+    
+    def __init__(self, max_rate, min_rate=0.5, increase_after=10):
+        super().__init__(max_rate)
+        self.max_rate = max_rate
+        self.min_rate = min_rate
+        self.increase_after = increase_after  # Consecutive successes before raising the rate
+        self.success_streak = 0
+    
+    def record_success(self):
+        """Additively raise the rate after a run of successful requests."""
+        with self.lock:
+            self.success_streak += 1
+            if self.success_streak >= self.increase_after and self.rate < self.max_rate:
+                self.rate = min(self.rate + 1, self.max_rate)
+                self.success_streak = 0
+    
+    def record_throttle(self):
+        """Halve the rate after a 429 response and return the new rate."""
+        with self.lock:
+            self.rate = max(self.rate * 0.5, self.min_rate)
+            self.tokens = min(self.tokens, 0.0)
+            self.success_streak = 0
+            return self.rate
+
+
+def write_atomic(path: Path, data: bytes) -> None:
+    """Write bytes to a temp file and rename it into place, so a crash never leaves a partial file.
+    
+    Shared by download_data.py and sec_scraper.py. The temp file is removed if the write or rename fails.
+    
+    Args:
+        path: Destination file
+        data: Bytes to write
+    """
+    tmp_path = path.with_name(path.name + '.tmp')
+    try:
+        # Buffered write raises on a short write, so a truncated temp file is never renamed into place
+        with open(tmp_path, 'wb') as f:
+            f.write(data)
+        os.replace(tmp_path, path)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
+
+
 class SECSubmissionsDownloader:
     """Downloads SEC submissions data for specified CIKs."""
     
     def __init__(self, output_dir: str = "data/submissions", max_workers: int = 10, 
-                 retry_attempts: int = 3, delay_seconds: float = 2.0):
+                 retry_attempts: int = 3, delay_seconds: float = 2.0, rate_limit: float = 9.0):
         self.output_dir = Path(output_dir)
         self.base_url = "https://data.sec.gov/submissions"
         self.max_workers = max_workers
         self.retry_attempts = retry_attempts
-        self.delay_seconds = delay_seconds
+        self.delay_seconds = delay_seconds  # Base backoff between retry attempts
+        
+        # Date folder fixed for the whole run, so a run crossing midnight keeps writing to one day
+        self.run_date = datetime.now().strftime('%Y%m%d')
+        self.date_dir = self.output_dir / self.run_date
+        self.cik_base_dir = self.date_dir / "CIK"
+        
+        # Shared across worker threads; stays under SEC's 10 requests/second and backs off on 429s
+        self.rate_limit = rate_limit
+        self.rate_limiter = AdaptiveTokenBucket(rate_limit)
         
         # SEC requires a User-Agent header
         self.headers = {
@@ -58,11 +167,26 @@ class SECSubmissionsDownloader:
             "Accept": "application/json"
         }
         
-        # Thread-safe tracking
-        self.download_lock = threading.Lock()
-        self.failed_ciks: Set[str] = set()
-        self.completed_ciks: Set[str] = set()
+        # One pooled session for every request, so worker threads reuse keep-alive connections
+        # (two host pools: data.sec.gov, plus www.sec.gov when download_data.py fetches filings with it)
+        self.session = requests.Session()
+        self.session.headers.update(self.headers)
+        adapter = HTTPAdapter(pool_connections=2, pool_maxsize=max(self.max_workers, 1))
+        self.session.mount("https://", adapter)
+        
+        # Per-CIK ETag / Last-Modified of the last saved submissions.json, for conditional GETs
+        self.http_cache_dir = self.output_dir / "http_cache"
+        self.pending_validators: Dict[str, Dict[str, str]] = {}
+        
+        # Outcomes are carried by the DownloadResult each worker returns, so no shared state is locked
         self.results: List[DownloadResult] = []
+        
+        # CIKs found on disk by scan_existing_downloads(); None means check each CIK with a stat
+        self.existing_ciks: Optional[frozenset] = None
+    
+    def close(self) -> None:
+        """Close the pooled session and its keep-alive connections."""
+        self.session.close()
     
     def load_ciks_from_database(self, database_path: str) -> List[str]:
         """Load unique CIKs from the CIK database.
@@ -74,8 +198,8 @@ class SECSubmissionsDownloader:
             List of unique CIKs
         """
         try:
-            with open(database_path, 'r', encoding='utf-8') as f:
-                data = json.load(f)
+            with open(database_path, 'rb') as f:
+                data = orjson.loads(f.read())
             
             # Extract unique CIKs from companies
             ciks = set()
@@ -104,22 +228,82 @@ class SECSubmissionsDownloader:
             True if data already exists for today
         """
         cik = cik.zfill(10)
-        today = datetime.now().strftime('%Y%m%d')
-        date_dir = self.output_dir / today
-        cik_base_dir = date_dir / "CIK"
-        cik_dir = cik_base_dir / cik
-        submissions_file = cik_dir / "submissions.json"
-        return submissions_file.exists()
-        
-    def download_submissions(self, cik: str, verbose: bool = True) -> Dict[str, Any]:
+        if self.existing_ciks is not None:
+            return cik in self.existing_ciks
+        
+        return (self.cik_base_dir / cik / "submissions.json").exists()
+    
+    def scan_existing_downloads(self) -> frozenset:
+        """Collect the CIKs that already have a submissions.json for today in one directory scan.
+        
+        Returns:
+            Frozenset of 10-digit CIKs downloaded today
+        """
+        try:
+            with os.scandir(self.cik_base_dir) as entries:
+                return frozenset(
+                    entry.name for entry in entries
+                    if entry.is_dir() and os.path.exists(os.path.join(entry.path, "submissions.json"))
+                )
+        except FileNotFoundError:
+            return frozenset()
+    
+    def load_http_cache(self, cik: str) -> Tuple[Dict[str, str], Optional[Path]]:
+        """Load the conditional request headers saved for a CIK.
+        
+        Args:
+            cik: 10-digit CIK with leading zeros
+            
+        Returns:
+            Tuple of the conditional headers and the cached submissions file
+            (empty headers and None when nothing usable is cached)
+        """
+        cache_file = self.http_cache_dir / f"{cik}.json"
+        try:
+            cached = orjson.loads(cache_file.read_bytes())
+        except (OSError, orjson.JSONDecodeError):
+            return {}, None
+        
+        cached_file = self.output_dir / cached.get('file', '')
+        if not cached.get('file') or not cached_file.exists():
+            return {}, None
+        
+        headers = {}
+        if cached.get('etag'):
+            headers['If-None-Match'] = cached['etag']
+        if cached.get('last_modified'):
+            headers['If-Modified-Since'] = cached['last_modified']
+        return headers, cached_file
+    
+    def save_http_cache(self, cik: str, output_file: Path) -> None:
+        """Persist the validators from the last download of a CIK.
+        
+        Args:
+            cik: 10-digit CIK with leading zeros
+            output_file: Saved submissions.json holding the response body
+        """
+        validators = self.pending_validators.pop(cik, None)
+        if not validators:
+            return
+        
+        self.http_cache_dir.mkdir(parents=True, exist_ok=True)
+        (self.http_cache_dir / f"{cik}.json").write_bytes(orjson.dumps({
+            **validators,
+            "file": str(output_file.relative_to(self.output_dir))
+        }))
+        
+    def download_submissions(self, cik: str, verbose: bool = True,
+                             use_cache: bool = False) -> Tuple[Dict[str, Any], bytes]:
         """Download submissions data for a given CIK.
         
         Args:
             cik: 10-digit CIK with leading zeros
             verbose: Whether to print detailed information
+            use_cache: Send the saved ETag / Last-Modified and reuse the saved file on 304;
+                the new validators are persisted by save_submissions
             
         Returns:
-            Dictionary containing the submissions data
+            Tuple of the parsed submissions data and the raw response body
         """
         # Ensure CIK is 10 digits with leading zeros
         cik = cik.zfill(10)
@@ -128,11 +312,33 @@ class SECSubmissionsDownloader:
         if verbose:
             print(f"Downloading submissions data for CIK {cik}...")
         
+        conditional_headers, cached_file = self.load_http_cache(cik) if use_cache else ({}, None)
+        
         try:
-            response = requests.get(url, headers=self.headers)
+            self.rate_limiter.acquire()
+            response = self.session.get(url, headers=conditional_headers, timeout=30)
+            
+            if response.status_code == 304:
+                # Unchanged since the last download; reuse the saved copy and keep its validators
+                body = cached_file.read_bytes()
+                data = orjson.loads(body)
+                self.pending_validators[cik] = {
+                    "etag": conditional_headers.get('If-None-Match'),
+                    "last_modified": conditional_headers.get('If-Modified-Since')
+                }
+                if verbose:
+                    print(f"Submissions for CIK {cik} unchanged, reusing {cached_file}")
+                return data, body
+            
             response.raise_for_status()
             
-            data = response.json()
+            body = response.content
+            data = orjson.loads(body)
+            if use_cache and (response.headers.get('ETag') or response.headers.get('Last-Modified')):
+                self.pending_validators[cik] = {
+                    "etag": response.headers.get('ETag'),
+                    "last_modified": response.headers.get('Last-Modified')
+                }
             if verbose:
                 print(f"Successfully downloaded data for CIK {cik}")
                 print(f"Company: {data.get('name', 'Unknown')}")
@@ -151,13 +357,13 @@ class SECSubmissionsDownloader:
                         unique_forms = list(set(form_types[:20]))  # Show first 20 unique forms
                         print(f"Recent form types: {', '.join(unique_forms)}")
             
-            return data
+            return data, body
             
         except requests.exceptions.RequestException as e:
             if verbose:
                 print(f"Error downloading data for CIK {cik}: {e}")
             raise
-        except json.JSONDecodeError as e:
+        except orjson.JSONDecodeError as e:
             if verbose:
                 print(f"Error parsing JSON response for CIK {cik}: {e}")
             raise
@@ -175,40 +381,22 @@ class SECSubmissionsDownloader:
         
         # Check if already downloaded
         if self.cik_already_downloaded(cik):
-            with self.download_lock:
-                self.completed_ciks.add(cik)
-            today = datetime.now().strftime('%Y%m%d')
-            date_dir = self.output_dir / today
-            cik_base_dir = date_dir / "CIK"
-            cik_dir = cik_base_dir / cik
             return DownloadResult(
                 cik=cik,
                 success=True,
-                file_path=str(cik_dir / "submissions.json"),
+                file_path=str(self.cik_base_dir / cik / "submissions.json"),
                 company_name="Already downloaded",
                 attempt_count=0
             )
         
         for attempt in range(1, self.retry_attempts + 1):
             try:
-                # Add delay before download (except first attempt)
-                if attempt > 1:
-                    time.sleep(self.delay_seconds)
-                
-                # Download data
-                data = self.download_submissions(cik, verbose=False)
+                # Download data (paced by the shared rate limiter rather than a fixed sleep)
+                data, body = self.download_submissions(cik, verbose=False, use_cache=True)
+                self.rate_limiter.record_success()
                 
                 # Save data
-                file_path = self.save_submissions(cik, data)
-                
-                # Add delay after successful download
-                time.sleep(self.delay_seconds)
-                
-                # Track success
-                with self.download_lock:
-                    self.completed_ciks.add(cik)
-                    if cik in self.failed_ciks:
-                        self.failed_ciks.remove(cik)
+                file_path = self.save_submissions(cik, data, body)
                 
                 return DownloadResult(
                     cik=cik,
@@ -222,11 +410,12 @@ class SECSubmissionsDownloader:
                 error_msg = str(e)
                 print(f"Attempt {attempt}/{self.retry_attempts} failed for CIK {cik}: {error_msg}")
                 
+                if getattr(getattr(e, 'response', None), 'status_code', None) == 429:
+                    new_rate = self.rate_limiter.record_throttle()
+                    print(f"SEC throttled CIK {cik}, slowing to {new_rate:g} requests/second")
+                
                 if attempt == self.retry_attempts:
                     # Final failure
-                    with self.download_lock:
-                        self.failed_ciks.add(cik)
-                    
                     return DownloadResult(
                         cik=cik,
                         success=False,
@@ -235,7 +424,7 @@ class SECSubmissionsDownloader:
                     )
                 
                 # Wait before retry
-                time.sleep(self.delay_seconds * attempt)  # Exponential backoff
+                time.sleep(self.retry_delay(attempt, e))
         
         # Should not reach here
         return DownloadResult(
@@ -245,12 +434,40 @@ class SECSubmissionsDownloader:
             attempt_count=self.retry_attempts
         )
     
-    def save_submissions(self, cik: str, data: Dict[str, Any]) -> str:
+    def retry_delay(self, attempt: int, error: Exception) -> float:
+        """Work out how long to wait before retrying a failed download.
+        
+        Args:
+            attempt: Number of the attempt that just failed (1-based)
+            error: Exception raised by that attempt
+            
+        Returns:
+            Seconds to wait: SEC's Retry-After when the response carries one,
+            otherwise jittered exponential backoff from delay_seconds
+        """
+        response = getattr(error, 'response', None)
+        retry_after = response.headers.get('Retry-After') if response is not None else None
+        if retry_after:
+            try:
+                return max(float(retry_after), 0.0)
+            except ValueError:
+                pass
+            try:
+                retry_at = parsedate_to_datetime(retry_after)
+                return max((retry_at - datetime.now(timezone.utc)).total_seconds(), 0.0)
+            except (TypeError, ValueError):
+                pass
+        
+        # Jitter keeps workers that failed together from retrying in lockstep
+        return self.delay_seconds * (2 ** (attempt - 1)) * random.uniform(0.5, 1.5)
+    
+    def save_submissions(self, cik: str, data: Dict[str, Any], raw: Optional[bytes] = None) -> str:
         """Save submissions data to file.
         
         Args:
             cik: 10-digit CIK with leading zeros
             data: Submissions data dictionary
+            raw: Response body as served by SEC; written verbatim instead of re-serializing data
             
         Returns:
             Path to saved file
@@ -259,49 +476,30 @@ class SECSubmissionsDownloader:
         cik = cik.zfill(10)
         
         # Create directory structure: data/submissions/{YYYYMMDD}/CIK/{cik}/
-        today = datetime.now().strftime('%Y%m%d')
-        date_dir = self.output_dir / today
-        cik_base_dir = date_dir / "CIK"
-        cik_dir = cik_base_dir / cik
+        cik_dir = self.cik_base_dir / cik
         cik_dir.mkdir(parents=True, exist_ok=True)
         
-        # Save main submissions file
-        output_file = cik_dir / "submissions.json"
+        # Save a summary file with key information first: submissions.json is what marks the CIK
+        # as downloaded (cik_already_downloaded), so it must be the last file to appear
+        summary = {"cik": cik}
+        summary.update((field, data.get(field, default)) for field, default in SUMMARY_FIELDS)
+        summary["filings_count"] = len(data.get('filings', {}).get('recent', {}).get('accessionNumber', []))
+        summary["download_timestamp"] = time.strftime('%Y-%m-%d %H:%M:%S UTC', time.gmtime())
         
-        with open(output_file, 'w', encoding='utf-8') as f:
-            json.dump(data, f, indent=2, ensure_ascii=False)
+        summary_file = cik_dir / "summary.json"
+        write_atomic(summary_file, orjson.dumps(summary, option=orjson.OPT_INDENT_2))
         
-        print(f"Saved submissions data to: {output_file}")
+        print(f"Saved summary to: {summary_file}")
         
-        # Also save a summary file with key information
-        summary = {
-            "cik": cik,
-            "name": data.get('name'),
-            "entityType": data.get('entityType'),
-            "sic": data.get('sic'),
-            "sicDescription": data.get('sicDescription'),
-            "stateOfIncorporation": data.get('stateOfIncorporation'),
-            "stateOfIncorporationDescription": data.get('stateOfIncorporationDescription'),
-            "fiscalYearEnd": data.get('fiscalYearEnd'),
-            "tickers": data.get('tickers', []),
-            "exchanges": data.get('exchanges', []),
-            "ein": data.get('ein'),
-            "description": data.get('description'),
-            "website": data.get('website'),
-            "investorWebsite": data.get('investorWebsite'),
-            "category": data.get('category'),
-            "phone": data.get('phone'),
-            "flags": data.get('flags'),
-            "formerNames": data.get('formerNames', []),
-            "filings_count": len(data.get('filings', {}).get('recent', {}).get('accessionNumber', [])),
-            "download_timestamp": time.strftime('%Y-%m-%d %H:%M:%S UTC', time.gmtime())
-        }
+        # Save main submissions file
+        output_file = cik_dir / "submissions.json"
         
-        summary_file = cik_dir / "summary.json"
-        with open(summary_file, 'w', encoding='utf-8') as f:
-            json.dump(summary, f, indent=2, ensure_ascii=False)
+        # SEC already serves valid (compact) JSON, so keep its bytes rather than re-encoding the parsed dict;
+        # this file is machine-read, so it stays compact either way
+        write_atomic(output_file, raw if raw is not None else orjson.dumps(data))
+        self.save_http_cache(cik, output_file)
         
-        print(f"Saved summary to: {summary_file}")
+        print(f"Saved submissions data to: {output_file}")
         
         return str(output_file)
     
@@ -315,80 +513,89 @@ class SECSubmissionsDownloader:
         Returns:
             Path to the created markdown file
         """
-        today = datetime.now().strftime('%Y%m%d')
-        date_dir = self.output_dir / today
+        today = self.run_date
+        date_dir = self.date_dir
         report_file = date_dir / f"{today}.md"
         
         # Count statistics
         total_folders = 0
         if date_dir.exists():
             total_folders = len([d for d in date_dir.iterdir() if d.is_dir() and d.name.startswith('CIK')])
-        successful_downloads = sum(1 for r in results if r.success)
-        failed_downloads = sum(1 for r in results if not r.success)
         
-        # Load CIK database for company info if provided
-        company_info = {}
+        # Sort results by CIK for consistent ordering, splitting them in the same pass
+        successful_results = []
+        failed_results = []
+        for result in sorted(results, key=lambda x: x.cik):
+            if result.success:
+                successful_results.append(result)
+            else:
+                failed_results.append(result)
+        successful_downloads = len(successful_results)
+        failed_downloads = len(failed_results)
+        
+        # Load CIK database for company info if provided: CIK -> (ticker, name)
+        company_info: Dict[str, Tuple[str, str]] = {}
+        unknown_company = ('N/A', 'Unknown')
         total_companies_in_db = 0
         if database_path and os.path.exists(database_path):
             try:
-                with open(database_path, 'r') as f:
-                    db_data = json.load(f)
+                with open(database_path, 'rb') as f:
+                    db_data = orjson.loads(f.read())
                     total_companies_in_db = db_data.get('metadata', {}).get('total_companies', 0)
-                    for company in db_data.get('companies', []):
-                        cik = str(company.get('cik', '')).zfill(10)
-                        company_info[cik] = {
-                            'ticker': company.get('ticker', 'N/A'),
-                            'name': company.get('name', 'Unknown')
-                        }
+                    # cik_database.json stores the name as company_name
+                    company_info = {
+                        str(company.get('cik', '')).zfill(10): (
+                            company.get('ticker', 'N/A'),
+                            company.get('company_name') or company.get('name', 'Unknown')
+                        )
+                        for company in db_data.get('companies', [])
+                    }
             except Exception as e:
                 print(f"Warning: Could not load company info from database: {e}")
         
-        # Create markdown content
-        content = f"# SEC Submissions Download Report - {today}\n\n"
-        content += f"## Summary Statistics\n\n"
-        content += f"- **Total Companies in Database**: {total_companies_in_db}\n"
-        content += f"- **Total Folders Created**: {total_folders}\n"
-        content += f"- **Successfully Downloaded**: {successful_downloads}\n"
-        content += f"- **Failed Downloads**: {failed_downloads}\n"
-        content += f"- **Download Date**: {datetime.now().strftime('%Y-%m-%d %H:%M:%S UTC')}\n\n"
+        # Create markdown content (collected as parts and joined once)
+        parts = [
+            f"# SEC Submissions Download Report - {today}\n\n",
+            f"## Summary Statistics\n\n",
+            f"- **Total Companies in Database**: {total_companies_in_db}\n",
+            f"- **Total Folders Created**: {total_folders}\n",
+            f"- **Successfully Downloaded**: {successful_downloads}\n",
+            f"- **Failed Downloads**: {failed_downloads}\n",
+            f"- **Download Date**: {datetime.now().strftime('%Y-%m-%d %H:%M:%S UTC')}\n\n"
+        ]
         
         if total_companies_in_db > 0:
             completion_rate = (total_folders / total_companies_in_db) * 100
-            content += f"- **Completion Rate**: {completion_rate:.2f}%\n\n"
+            parts.append(f"- **Completion Rate**: {completion_rate:.2f}%\n\n")
         
         # Create table of downloaded companies
-        content += f"## Downloaded Companies\n\n"
-        content += f"| CIK | Ticker | Company Name | Status |\n"
-        content += f"|-----|--------|--------------|--------|\n"
-        
-        # Sort results by CIK for consistent ordering
-        sorted_results = sorted(results, key=lambda x: x.cik)
+        parts.append(f"## Downloaded Companies\n\n")
+        parts.append(f"| CIK | Ticker | Company Name | Status |\n")
+        parts.append(f"|-----|--------|--------------|--------|\n")
         
-        for result in sorted_results:
-            if result.success:
-                cik = result.cik
-                ticker = company_info.get(cik, {}).get('ticker', 'N/A')
-                company_name = result.company_name or company_info.get(cik, {}).get('name', 'Unknown')
-                status = "✅ Downloaded"
-                content += f"| {cik} | {ticker} | {company_name} | {status} |\n"
+        for result in successful_results:
+            cik = result.cik
+            ticker, db_name = company_info.get(cik, unknown_company)
+            company_name = result.company_name or db_name
+            status = "✅ Downloaded"
+            parts.append(f"| {cik} | {ticker} | {company_name} | {status} |\n")
         
         # Add failed downloads section if any
         if failed_downloads > 0:
-            content += f"\n## Failed Downloads\n\n"
-            content += f"| CIK | Ticker | Company Name | Error |\n"
-            content += f"|-----|--------|--------------|-------|\n"
+            parts.append(f"\n## Failed Downloads\n\n")
+            parts.append(f"| CIK | Ticker | Company Name | Error |\n")
+            parts.append(f"|-----|--------|--------------|-------|\n")
             
-            for result in sorted_results:
-                if not result.success:
-                    cik = result.cik
-                    ticker = company_info.get(cik, {}).get('ticker', 'N/A')
-                    company_name = result.company_name or company_info.get(cik, {}).get('name', 'Unknown')
-                    error = result.error_message[:100] + "..." if len(result.error_message) > 100 else result.error_message
-                    content += f"| {cik} | {ticker} | {company_name} | {error} |\n"
+            for result in failed_results:
+                cik = result.cik
+                ticker, db_name = company_info.get(cik, unknown_company)
+                company_name = result.company_name or db_name
+                error = result.error_message[:100] + "..." if len(result.error_message) > 100 else result.error_message
+                parts.append(f"| {cik} | {ticker} | {company_name} | {error} |\n")
         
         # Write the report file
         with open(report_file, 'w', encoding='utf-8') as f:
-            f.write(content)
+            f.write("".join(parts))
         
         print(f"\nStatus report created: {report_file}")
         return str(report_file)
@@ -402,8 +609,8 @@ class SECSubmissionsDownloader:
         Returns:
             Path to the saved submissions file
         """
-        data = self.download_submissions(cik)
-        return self.save_submissions(cik, data)
+        data, body = self.download_submissions(cik, use_cache=True)
+        return self.save_submissions(cik, data, body)
     
     def download_bulk_with_retry(self, cik_database_path: str) -> List[DownloadResult]:
         """Download submissions for all CIKs in the database with retry logic.
@@ -418,68 +625,65 @@ class SECSubmissionsDownloader:
         ciks = self.load_ciks_from_database(cik_database_path)
         print(f"Found {len(ciks)} unique CIKs in database")
         
-        # Filter out already downloaded CIKs
+        # Filter out already downloaded CIKs (one scan of today's CIK directory instead of a stat per CIK)
+        self.existing_ciks = self.scan_existing_downloads()
         remaining_ciks = [cik for cik in ciks if not self.cik_already_downloaded(cik)]
         print(f"Need to download {len(remaining_ciks)} CIKs (skipping {len(ciks) - len(remaining_ciks)} already downloaded)")
         
         all_results = []
         retry_round = 1
         
-        while remaining_ciks:
-            print(f"\n=== Download Round {retry_round} ===")
-            print(f"Attempting to download {len(remaining_ciks)} CIKs with {self.max_workers} threads...")
-            
-            round_results = []
-            
-            # Use ThreadPoolExecutor for concurrent downloads
-            with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
-                # Submit all download tasks
-                future_to_cik = {
-                    executor.submit(self.download_single_cik_with_retry, cik): cik 
-                    for cik in remaining_ciks
-                }
+        def download_cik(cik: str) -> DownloadResult:
+            # Turn anything unexpected into a failed result so executor.map keeps going
+            try:
+                return self.download_single_cik_with_retry(cik)
+            except Exception as e:
+                return DownloadResult(
+                    cik=cik,
+                    success=False,
+                    error_message=f"Unexpected error: {e}",
+                    attempt_count=self.retry_attempts
+                )
+        
+        # One pool serves every round, so retry rounds reuse the warm worker threads.
+        # Workers only need to cover requests in flight (rate limit x latency, about 9 x 0.5s),
+        # so the default 10 keeps the rate limiter, not the pool, as the bottleneck.
+        with ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="sec-submissions") as executor:
+            while remaining_ciks:
+                print(f"\n=== Download Round {retry_round} ===")
+                print(f"Attempting to download {len(remaining_ciks)} CIKs with {self.max_workers} threads...")
                 
-                # Process completed downloads
-                for future in as_completed(future_to_cik):
-                    cik = future_to_cik[future]
-                    try:
-                        result = future.result()
-                        round_results.append(result)
-                        
-                        if result.success:
-                            print(f"✓ CIK {result.cik}: {result.company_name} (attempt {result.attempt_count})")
-                        else:
-                            print(f"✗ CIK {result.cik}: {result.error_message} (attempt {result.attempt_count})")
-                            
-                    except Exception as e:
-                        print(f"✗ CIK {cik}: Unexpected error: {e}")
-                        round_results.append(DownloadResult(
-                            cik=cik,
-                            success=False,
-                            error_message=f"Unexpected error: {e}",
-                            attempt_count=self.retry_attempts
-                        ))
-            
-            all_results.extend(round_results)
-            
-            # Check for failed downloads
-            failed_this_round = [r for r in round_results if not r.success]
-            successful_this_round = [r for r in round_results if r.success]
-            
-            print(f"\nRound {retry_round} completed:")
-            print(f"  Successful: {len(successful_this_round)}")
-            print(f"  Failed: {len(failed_this_round)}")
-            
-            # Update remaining CIKs (only failed ones)
-            remaining_ciks = [r.cik for r in failed_this_round]
-            
-            if not remaining_ciks:
-                print("\n🎉 All downloads completed successfully!")
-                break
-            
-            retry_round += 1
-            print(f"\nWill retry {len(remaining_ciks)} failed CIKs in next round...")
-            time.sleep(5)  # Brief pause between rounds
+                round_results = []
+                
+                # Results come back in submission order and each carries its own CIK
+                for result in executor.map(download_cik, remaining_ciks):
+                    round_results.append(result)
+                    
+                    if result.success:
+                        print(f"✓ CIK {result.cik}: {result.company_name} (attempt {result.attempt_count})")
+                    else:
+                        print(f"✗ CIK {result.cik}: {result.error_message} (attempt {result.attempt_count})")
+                
+                all_results.extend(round_results)
+                
+                # Check for failed downloads
+                failed_this_round = [r for r in round_results if not r.success]
+                successful_this_round = [r for r in round_results if r.success]
+                
+                print(f"\nRound {retry_round} completed:")
+                print(f"  Successful: {len(successful_this_round)}")
+                print(f"  Failed: {len(failed_this_round)}")
+                
+                # Update remaining CIKs (only failed ones)
+                remaining_ciks = [r.cik for r in failed_this_round]
+                
+                if not remaining_ciks:
+                    print("\n🎉 All downloads completed successfully!")
+                    break
+                
+                retry_round += 1
+                print(f"\nWill retry {len(remaining_ciks)} failed CIKs in next round...")
+                time.sleep(5)  # Brief pause between rounds
         
         # Final summary
         total_successful = sum(1 for r in all_results if r.success)
@@ -551,7 +755,14 @@ Examples:
         '--delay',
         type=float,
         default=2.0,
-        help='Delay in seconds between downloads (default: 2.0)'
+        help='Base delay in seconds between retry attempts (default: 2.0)'
+    )
+    
+    parser.add_argument(
+        '--rate-limit',
+        type=float,
+        default=9.0,
+        help='Maximum SEC requests per second across all threads (default: 9.0)'
     )
     
     parser.add_argument(
@@ -562,11 +773,12 @@ Examples:
     )
     
     args = parser.parse_args()
+    downloader = None
     
     try:
         if args.cik:
             # Single CIK download
-            downloader = SECSubmissionsDownloader(args.output_dir)
+            downloader = SECSubmissionsDownloader(args.output_dir, rate_limit=args.rate_limit)
             file_path = downloader.download_and_save(args.cik)
             print(f"\nData saved to: {file_path}")
             
@@ -576,20 +788,20 @@ Examples:
                 output_dir=args.output_dir,
                 max_workers=args.workers,
                 retry_attempts=args.retry_attempts,
-                delay_seconds=args.delay
+                delay_seconds=args.delay,
+                rate_limit=args.rate_limit
             )
             
             print(f"Starting bulk download with {args.workers} workers...")
-            print(f"Delay between downloads: {args.delay} seconds")
+            print(f"Rate limit: {args.rate_limit:g} requests/second")
+            print(f"Retry delay: {args.delay} seconds")
             print(f"Retry attempts: {args.retry_attempts}")
             print(f"Output directory: {args.output_dir}")
             
             results = downloader.download_bulk_with_retry(args.bulk)
             
             # Save results summary
-            today = datetime.now().strftime('%Y%m%d')
-            date_dir = Path(args.output_dir) / today
-            results_file = date_dir / "download_results.json"
+            results_file = downloader.date_dir / "download_results.json"
             results_data = {
                 "timestamp": time.strftime('%Y-%m-%d %H:%M:%S UTC', time.gmtime()),
                 "total_ciks": len(results),
@@ -598,6 +810,7 @@ Examples:
                 "settings": {
                     "workers": args.workers,
                     "delay_seconds": args.delay,
+                    "rate_limit": args.rate_limit,
                     "retry_attempts": args.retry_attempts
                 },
                 "results": [{
@@ -610,14 +823,17 @@ Examples:
                 } for r in results]
             }
             
-            with open(results_file, 'w') as f:
-                json.dump(results_data, f, indent=2)
+            with open(results_file, 'wb') as f:
+                f.write(orjson.dumps(results_data, option=orjson.OPT_INDENT_2))
             
             print(f"\nDownload results saved to: {results_file}")
         
     except Exception as e:
         print(f"Error: {e}")
         return 1
+    finally:
+        if downloader is not None:
+            downloader.close()
     
     return 0
 
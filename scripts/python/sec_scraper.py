@@ -7,28 +7,50 @@ and downloads all .txt files from each filing folder.
 
 Usage:
     python sec_scraper.py
+    python sec_scraper.py --debug   # also print page structure while parsing listings
 """
 
+import orjson
 import requests
+from requests.adapters import HTTPAdapter
 import os
 import re
-import time
-from urllib.parse import urljoin, urlparse
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import urljoin
 from pathlib import Path
-from bs4 import BeautifulSoup
-from typing import List, Set
+from bs4 import BeautifulSoup, SoupStrainer
+from typing import List, Optional, Set
+
+from download_sec_submissions import AdaptiveTokenBucket, write_atomic
+
+# Accession number as listed in a directory row: XXXXXXXXXX-XX-XXXXXX or just 18 digits like 000117266125001828
+ACCESSION_NUMBER_RE = re.compile(r'^(?:\d{10}-\d{2}-\d{6}|\d{18})$')
+
+# Dashed accession number anywhere in a link
+ACCESSION_IN_LINK_RE = re.compile(r'\d{10}-\d{2}-\d{6}')
+
+# Folder pages (fallback when a folder has no index.json) are only searched for file links,
+# so only their <a href> tags are built into the tree
+FILE_LINKS_ONLY = SoupStrainer('a', href=re.compile(r'\.txt$'))
 
 class SECScraper:
-    def __init__(self, base_url: str, download_dir: str = "data/sec_filings"):
+    def __init__(self, base_url: str, download_dir: str = "data/sec_filings", max_workers: int = 4,
+                 rate_limit: float = 9.0, debug: bool = False):
         """
         Initialize the SEC scraper
         
         Args:
             base_url: Base URL for the SEC archive
             download_dir: Directory to save downloaded files
+            max_workers: Number of threads fetching folder pages, and again downloading files
+            rate_limit: Maximum SEC requests per second across all threads
+            debug: Print page structure and rejected listing rows while scraping
         """
         self.base_url = base_url.rstrip('/')
         self.download_dir = Path(download_dir)
+        self.max_workers = max_workers
+        self.debug = debug
         self.session = requests.Session()
         
         # Set headers that comply with SEC requirements
@@ -42,31 +64,110 @@ class SECScraper:
             'Host': 'www.sec.gov',
         })
         
+        # Every request goes to www.sec.gov: one host pool with a keep-alive connection per worker thread
+        # (folder-page and download pools together)
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=max(2 * self.max_workers, 1))
+        self.session.mount('https://', adapter)
+        
         # Create download directory
         self.download_dir.mkdir(parents=True, exist_ok=True)
         
-        # Rate limiting - SEC recommends being respectful with request frequency
-        self.request_delay = 2.0  # Delay between requests in seconds
+        # Accession folders whose .txt files have all been downloaded, so re-runs skip their listing pages
+        self.completed_folders_file = self.download_dir / ".completed_folders.json"
+        
+        # Rate limiting - shared by all threads, stays under SEC's 10 requests/second and backs off on 429s
+        self.rate_limiter = AdaptiveTokenBucket(rate_limit)
+        
+    def check_throttled(self, response: requests.Response) -> None:
+        """
+        Feed a response back into the rate limiter
+        
+        Args:
+            response: Response from SEC
+        """
+        if response.status_code == 429:
+            new_rate = self.rate_limiter.record_throttle()
+            print(f"⚠️  SEC throttled the scraper, slowing to {new_rate:g} requests/second")
+        elif response.ok:
+            self.rate_limiter.record_success()
+    
+    def load_completed_folders(self) -> Set[str]:
+        """
+        Load the accession folders finished by earlier runs
+        
+        Returns:
+            Set of accession folder names (empty if there is no index yet)
+        """
+        try:
+            return set(orjson.loads(self.completed_folders_file.read_bytes()))
+        except (OSError, orjson.JSONDecodeError):
+            return set()
+    
+    def save_completed_folders(self, completed: Set[str]) -> None:
+        """
+        Persist the finished accession folders, replacing the index atomically
+        
+        Args:
+            completed: Set of accession folder names
+        """
+        write_atomic(self.completed_folders_file, orjson.dumps(sorted(completed)))
+    
+    @staticmethod
+    def folder_accession(folder_url: str) -> str:
+        """
+        Get the accession folder name from a folder URL
+        
+        Args:
+            folder_url: URL of an accession folder
+            
+        Returns:
+            Last path component, e.g. 000117266125001828
+        """
+        return folder_url.rstrip('/').rsplit('/', 1)[-1]
+    
+    def get_index_json(self, url: str) -> Optional[dict]:
+        """
+        Fetch the JSON listing SEC publishes for every archive directory (<directory>/index.json)
         
-    def get_page_content(self, url: str) -> BeautifulSoup:
+        Args:
+            url: URL of the archive directory
+            
+        Returns:
+            Parsed listing, or None if it could not be fetched
+        """
+        index_url = f"{url.rstrip('/')}/index.json"
+        try:
+            print(f"📡 Fetching: {index_url}")
+            self.rate_limiter.acquire()
+            response = self.session.get(index_url, timeout=30)
+            self.check_throttled(response)
+            response.raise_for_status()
+            
+            return orjson.loads(response.content)
+            
+        except (requests.RequestException, orjson.JSONDecodeError) as e:
+            print(f"❌ Error fetching {index_url}: {e}")
+            return None
+    
+    def get_page_content(self, url: str, parse_only: Optional[SoupStrainer] = None) -> BeautifulSoup:
         """
         Fetch and parse a web page
         
         Args:
             url: URL to fetch
+            parse_only: Restrict parsing to the matching tags
             
         Returns:
             BeautifulSoup object of the parsed HTML
         """
         try:
             print(f"📡 Fetching: {url}")
+            self.rate_limiter.acquire()
             response = self.session.get(url, timeout=30)
+            self.check_throttled(response)
             response.raise_for_status()
             
-            # Rate limiting
-            time.sleep(self.request_delay)
-            
-            return BeautifulSoup(response.content, 'html.parser')
+            return BeautifulSoup(response.content, 'lxml', parse_only=parse_only)
             
         except requests.RequestException as e:
             print(f"❌ Error fetching {url}: {e}")
@@ -86,29 +187,49 @@ class SECScraper:
         """
         folder_links = []
         
-        print("\n🔍 Debug: Looking for accession numbers in table rows...")
+        if self.debug:
+            print("\n🔍 Debug: Looking for accession numbers in table rows...")
         
         # Find all table rows
         table_rows = soup.find_all('tr')
         
         for row in table_rows:
-            cells = row.find_all(['td', 'th'])
-            if cells and len(cells) >= 1:
-                # The first cell typically contains the accession number
-                first_cell = cells[0].get_text(strip=True)
-                
-                # Check if this looks like an accession number
-                # Can be format: XXXXXXXXXX-XX-XXXXXX or just 18 digits like 000117266125001828
-                if (re.match(r'^\d{10}-\d{2}-\d{6}$', first_cell) or 
-                    re.match(r'^\d{18}$', first_cell)):
-                    print(f"  ✅ Found accession number: {first_cell}")
-                    # Build the folder URL
-                    folder_url = f"{base_url.rstrip('/')}/{first_cell}/"
-                    folder_links.append(folder_url)
-                else:
-                    # Debug: show what we're checking
-                    if first_cell and len(first_cell) > 5:  # Only show substantial content
-                        print(f"  ❌ Not an accession number: '{first_cell}'")
+            # The first cell typically contains the accession number; find stops there instead of listing every cell
+            first = row.find(['td', 'th'])
+            if first is None:
+                continue
+            first_cell = first.get_text(strip=True)
+            
+            # Check if this looks like an accession number
+            if ACCESSION_NUMBER_RE.match(first_cell):
+                print(f"  ✅ Found accession number: {first_cell}")
+                # Build the folder URL
+                folder_url = f"{base_url.rstrip('/')}/{first_cell}/"
+                folder_links.append(folder_url)
+            elif self.debug:
+                # Debug: show what we're checking
+                if first_cell and len(first_cell) > 5:  # Only show substantial content
+                    print(f"  ❌ Not an accession number: '{first_cell}'")
+        
+        print(f"\n📁 Total folders found: {len(folder_links)}")
+        return folder_links
+    
+    def extract_folder_links_from_index(self, index: dict, base_url: str) -> List[str]:
+        """
+        Extract accession folder links from a JSON directory listing
+        
+        Args:
+            index: Parsed index.json of the archive directory
+            base_url: Base URL for building folder links
+            
+        Returns:
+            List of folder URLs
+        """
+        folder_links = [
+            f"{base_url.rstrip('/')}/{item['name']}/"
+            for item in index.get('directory', {}).get('item', [])
+            if item.get('type') == 'folder.gif' and ACCESSION_NUMBER_RE.match(item.get('name', ''))
+        ]
         
         print(f"\n📁 Total folders found: {len(folder_links)}")
         return folder_links
@@ -129,13 +250,36 @@ class SECScraper:
         for link in soup.find_all('a', href=True):
             href = link['href']
             
+            # Also checked here, since the soup is not always parsed with FILE_LINKS_ONLY
             if href.endswith('.txt'):
                 full_url = urljoin(base_url, href)
                 txt_files.append(full_url)
-                print(f"📄 Found txt file: {href}")
         
         return txt_files
     
+    def list_folder_txt_files(self, folder_url: str) -> Optional[List[str]]:
+        """
+        List the .txt files of a filing folder from its index.json, falling back to the HTML page
+        
+        Args:
+            folder_url: URL of the accession folder
+            
+        Returns:
+            List of .txt file URLs, or None if the folder could not be listed
+        """
+        index = self.get_index_json(folder_url)
+        if index is not None:
+            return [
+                f"{folder_url.rstrip('/')}/{item['name']}"
+                for item in index.get('directory', {}).get('item', [])
+                if item.get('name', '').endswith('.txt')
+            ]
+        
+        folder_soup = self.get_page_content(folder_url, FILE_LINKS_ONLY)
+        if not folder_soup:
+            return None
+        return self.find_txt_files(folder_soup, folder_url)
+    
     def download_file(self, url: str, local_path: Path) -> bool:
         """
         Download a file from URL to local path
@@ -147,44 +291,37 @@ class SECScraper:
         Returns:
             True if successful, False otherwise
         """
+        tmp_path = local_path.with_name(local_path.name + '.tmp')
         try:
-            print(f"⬇️  Downloading: {url}")
-            
-            response = self.session.get(url, timeout=60)
-            response.raise_for_status()
-            
-            # Create parent directories if they don't exist
-            local_path.parent.mkdir(parents=True, exist_ok=True)
-            
-            # Write file
-            with open(local_path, 'wb') as f:
-                f.write(response.content)
+            self.rate_limiter.acquire()
+            with self.session.get(url, timeout=60, stream=True) as response:
+                self.check_throttled(response)
+                response.raise_for_status()
+                
+                # Stream to a temp file in 1 MB chunks (full submissions can be hundreds of MB) and
+                # rename it into place, so an interrupted download is never mistaken for an existing file
+                with open(tmp_path, 'wb') as f:
+                    for chunk in response.iter_content(chunk_size=1024 * 1024):
+                        f.write(chunk)
+                os.replace(tmp_path, local_path)
             
             print(f"✅ Saved: {local_path}")
             
-            # Rate limiting
-            time.sleep(self.request_delay)
-            
             return True
             
         except Exception as e:
+            # Don't leave a partial .tmp file in the download directory
+            tmp_path.unlink(missing_ok=True)
             print(f"❌ Error downloading {url}: {e}")
             return False
     
-    def scrape_archive(self) -> None:
+    def print_page_structure(self, soup: BeautifulSoup) -> None:
         """
-        Main scraping method - discovers folders and downloads .txt files
-        """
-        print(f"🚀 Starting SEC archive scrape: {self.base_url}")
-        print(f"📂 Download directory: {self.download_dir}")
+        Print the links, <pre> blocks and table rows of a page to help debug listing parsing
         
-        # Get the main archive page
-        soup = self.get_page_content(self.base_url)
-        if not soup:
-            print("❌ Failed to fetch main archive page")
-            return
-        
-        # Debug: Check page structure
+        Args:
+            soup: BeautifulSoup object of the page
+        """
         all_links = soup.find_all('a', href=True)
         print(f"🔍 Analyzing {len(all_links)} links on the page")
         
@@ -220,7 +357,7 @@ class SECScraper:
         accession_links = []
         for link in all_links:
             href = link['href']
-            if re.search(r'\d{10}-\d{2}-\d{6}', href):
+            if ACCESSION_IN_LINK_RE.search(href):
                 accession_links.append(href)
         
         if accession_links:
@@ -229,62 +366,111 @@ class SECScraper:
                 print(f"  {link}")
         else:
             print("\n❌ No accession number patterns found in any links")
+    
+    def scrape_archive(self, soup: Optional[BeautifulSoup] = None, index: Optional[dict] = None) -> None:
+        """
+        Main scraping method - discovers folders and downloads .txt files
         
-        # Extract folder links
-        folder_links = self.extract_folder_links(soup, self.base_url)
+        Args:
+            soup: Already-parsed main archive page, used instead of the JSON listing
+            index: Already-fetched JSON listing of the archive; fetched when neither is given
+        """
+        print(f"🚀 Starting SEC archive scrape: {self.base_url}")
+        print(f"📂 Download directory: {self.download_dir}")
+        
+        # Prefer the JSON directory listing: no HTML to parse and no table rows to scrape
+        if soup is None and index is None:
+            index = self.get_index_json(self.base_url)
+        
+        if index is not None:
+            folder_links = self.extract_folder_links_from_index(index, self.base_url)
+        else:
+            # Fall back to the HTML directory listing
+            if soup is None:
+                soup = self.get_page_content(self.base_url)
+            if not soup:
+                print("❌ Failed to fetch main archive page")
+                return
+            
+            # Page structure dump for diagnosing listing changes; it walks the whole DOM, so only with --debug
+            if self.debug:
+                self.print_page_structure(soup)
+            
+            # Extract folder links
+            folder_links = self.extract_folder_links(soup, self.base_url)
         
         if not folder_links:
             print("❌ No folders found in archive")
             return
         
-        print(f"📊 Found {len(folder_links)} folders to process")
+        # Folders finished by an earlier run are skipped without fetching their listing pages
+        completed_folders = self.load_completed_folders()
+        total_folders = len(folder_links)
+        folder_links = [url for url in folder_links if self.folder_accession(url) not in completed_folders]
+        
+        print(f"📊 Found {total_folders} folders, {len(folder_links)} to process "
+              f"({total_folders - len(folder_links)} completed in earlier runs)")
         
         downloaded_count = 0
         failed_count = 0
         
-        # Process each folder
-        for i, folder_url in enumerate(folder_links, 1):
-            print(f"\n📁 Processing folder {i}/{len(folder_links)}: {folder_url}")
-            
-            # Get folder content
-            folder_soup = self.get_page_content(folder_url)
-            if not folder_soup:
-                failed_count += 1
-                continue
-            
-            # Find .txt files in this folder
-            txt_files = self.find_txt_files(folder_soup, folder_url)
-            
-            if not txt_files:
-                print("   ⚠️  No .txt files found in this folder")
-                continue
-            
-            # Download each .txt file
-            for txt_url in txt_files:
-                # Create local filename based on URL structure
-                parsed_url = urlparse(txt_url)
-                path_parts = parsed_url.path.strip('/').split('/')
-                
-                # Use the last few path components to create a meaningful filename
-                if len(path_parts) >= 2:
-                    folder_name = path_parts[-2]  # Parent folder name
-                    file_name = path_parts[-1]    # File name
-                    local_filename = f"{folder_name}_{file_name}"
-                else:
-                    local_filename = path_parts[-1]
-                
-                local_path = self.download_dir / local_filename
+        # Folder listings are fetched concurrently (each fetch is mostly network wait);
+        # map yields them in folder order, so they are processed in order while the rest load.
+        # Every missing .txt file is queued on one download pool as soon as its folder is parsed,
+        # so downloads from different folders run together instead of one folder at a time.
+        folder_downloads = []
+        
+        # Files go straight into download_dir (created in __init__), so one listing replaces a stat per file
+        existing_files = set(os.listdir(self.download_dir))
+        try:
+            with ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="sec-folders") as executor, \
+                    ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="sec-downloads") as downloader:
+                folder_listings = executor.map(self.list_folder_txt_files, folder_links)
                 
-                # Skip if file already exists
-                if local_path.exists():
-                    print(f"   ⏭️  Skipping existing file: {local_filename}")
-                    continue
+                # Process each folder
+                for i, (folder_url, txt_files) in enumerate(zip(folder_links, folder_listings), 1):
+                    print(f"\n📁 Processing folder {i}/{len(folder_links)}: {folder_url}")
+                    
+                    # .txt files in this folder (None if the listing could not be fetched)
+                    if txt_files is None:
+                        failed_count += 1
+                        continue
+                    
+                    if not txt_files:
+                        print("   ⚠️  No .txt files found in this folder")
+                        completed_folders.add(self.folder_accession(folder_url))
+                        continue
+                    
+                    print(f"   📄 Found {len(txt_files)} .txt files")
+                    
+                    # Queue the .txt files still missing locally
+                    folder_name = self.folder_accession(folder_url)  # Parent folder name, prefixed to each file
+                    futures = []
+                    for txt_url in txt_files:
+                        # Create local filename from the folder and file name
+                        local_filename = f"{folder_name}_{txt_url.rsplit('/', 1)[-1]}"
+                        local_path = self.download_dir / local_filename
+                        
+                        # Skip if file already exists (or is already queued, when a listing links it twice)
+                        if local_filename in existing_files:
+                            print(f"   ⏭️  Skipping existing file: {local_filename}")
+                            continue
+                        existing_files.add(local_filename)
+                        
+                        futures.append(downloader.submit(self.download_file, txt_url, local_path))
+                    
+                    folder_downloads.append((folder_url, futures))
                 
-                # Download the file
-                if self.download_file(txt_url, local_path):
-                    downloaded_count += 1
-                else:
-                    failed_count += 1
+                # Collect the outcomes; counts come from the returned flags, so no lock
+                for folder_url, futures in folder_downloads:
+                    results = [future.result() for future in futures]
+                    downloaded_count += sum(results)
+                    failed_count += len(results) - sum(results)
+                    
+                    if all(results):
+                        completed_folders.add(self.folder_accession(folder_url))
+        finally:
+            self.save_completed_folders(completed_folders)
         
         # Summary
         print(f"\n📈 Scraping completed!")
@@ -303,9 +489,16 @@ def main():
     print(f"🔍 Testing direct access to: {base_url}")
     
     # Initialize scraper
-    scraper = SECScraper(base_url)
+    scraper = SECScraper(base_url, debug='--debug' in sys.argv)
+    
+    # The JSON directory listing needs none of the HTML page checks below
+    index = scraper.get_index_json(base_url)
+    if index is not None:
+        print(f"✅ Got JSON directory listing with {len(index.get('directory', {}).get('item', []))} entries")
+        scraper.scrape_archive(index=index)
+        return
     
-    # Test the page first
+    # Fall back to the HTML listing: test the page first
     soup = scraper.get_page_content(base_url)
     if soup:
         # Check if we're getting redirected by looking at the page title
@@ -320,7 +513,7 @@ def main():
         # Check if this looks like a directory listing
         if "Index of" in page_text or "Directory" in page_text:
             print("✅ Looks like a directory listing")
-            scraper.scrape_archive()
+            scraper.scrape_archive(soup)
         else:
             print("❌ This doesn't appear to be a directory listing")
             print("💡 The SEC might be blocking direct archive access")